@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import logging
 import contextlib
+from collections.abc import Mapping
+from operator import itemgetter
+
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
@@ -16,6 +19,7 @@ from .const import (
     CONF_SOC_LIMIT_PERCENT,
     CONF_NET_POWER_TARGET_W,
 )
+from .controller import EVLoadController
 from .priority import async_cleanup_priority_if_removed
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,13 +27,24 @@ _LOGGER = logging.getLogger(__name__)
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 # Ignore runtime persistence keys so options changes for these do NOT trigger reloads
-IGNORED_OPTION_KEYS = {
+IGNORED_OPTION_KEYS = frozenset({
     CONF_OPT_MODE_ECO,
     CONF_PLANNER_START_ISO,
     CONF_PLANNER_STOP_ISO,
     CONF_SOC_LIMIT_PERCENT,
     CONF_NET_POWER_TARGET_W,
-}
+})
+
+# Domain-level bookkeeping keys in hass.data[DOMAIN]; dropped once the last entry unloads
+_INTERNAL_KEYS = ("_priority_anchor_entry_id", "_entry_ids")
+
+
+def _options_fingerprint(options: Mapping) -> tuple:
+    """Return the option items that matter for reloads, in a stable order."""
+    return tuple(sorted(
+        ((k, v) for k, v in options.items() if k not in IGNORED_OPTION_KEYS),
+        key=itemgetter(0),
+    ))
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
@@ -38,27 +53,25 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    from .controller import EVLoadController
-
-    _LOGGER.debug("EVCM: async_setup_entry starting for entry_id=%s", entry.entry_id)
+    entry_id = entry.entry_id
+    # Single lookup; setdefault (not hass.data[DOMAIN]) because unloading the last entry drops the domain dict
+    domain_store = hass.data.setdefault(DOMAIN, {})
+    _LOGGER.debug("EVCM: async_setup_entry starting for entry_id=%s", entry_id)
 
     # Instantiate controller and store immediately so platforms can find it
-    hass.data.setdefault(DOMAIN, {})
+    domain_store.setdefault("_entry_ids", set()).add(entry_id)
 
     try:
         controller = EVLoadController(hass, entry)
     except Exception as exc:
         _LOGGER.error("Controller construction failed for %s: %s", DOMAIN, exc, exc_info=True)
-        hass.data[DOMAIN][entry.entry_id] = {
-            "controller": None,
-            "last_options": dict(entry.options),
-            "post_start_scheduled": False,
-        }
+        # No fingerprint: any later options update on a failed entry should reload it
+        domain_store[entry_id] = {"controller": None, "post_start_scheduled": False}
         return False
 
-    hass.data[DOMAIN][entry.entry_id] = {
+    domain_store[entry_id] = {
         "controller": controller,
-        "last_options": dict(entry.options),
+        "last_fingerprint": _options_fingerprint(entry.options),
         "post_start_scheduled": False,
     }
 
@@ -66,7 +79,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # This ensures persisted state is loaded so entities won't fall back to defaults on first reload.
     try:
         await controller.async_initialize()
-        _LOGGER.debug("Controller initialization completed for entry_id=%s", entry.entry_id)
+        _LOGGER.debug("Controller initialization completed for entry_id=%s", entry_id)
     except Exception as exc:
         _LOGGER.error("Controller initialization failed for %s: %s", DOMAIN, exc, exc_info=True)
         # Attempt clean shutdown of controller if it partially initialized
@@ -76,9 +89,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Forward platforms after controller is initialized
     try:
-        _LOGGER.debug("Forwarding platforms for entry_id=%s: %s", entry.entry_id, PLATFORMS)
+        _LOGGER.debug("Forwarding platforms for entry_id=%s: %s", entry_id, PLATFORMS)
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-        _LOGGER.debug("Platform forward completed for entry_id=%s", entry.entry_id)
+        _LOGGER.debug("Platform forward completed for entry_id=%s", entry_id)
     except Exception as exc:
         _LOGGER.error("Platform forward failed: %s", exc, exc_info=True)
         try:
@@ -87,39 +100,92 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             pass
         return False
 
-    # Post-start hook: schedule exactly once per entry.
-    entry_data = hass.data[DOMAIN][entry.entry_id]
-    if not entry_data.get("post_start_scheduled"):
-        entry_data["post_start_scheduled"] = True
-        if hass.is_running:
-            _LOGGER.debug("Scheduling controller.async_post_start immediately (HA is running) for entry_id=%s", entry.entry_id)
-            hass.async_create_task(controller.async_post_start())
-        else:
-            @callback
-            def _on_started(_event):
-                _LOGGER.debug("Scheduling controller.async_post_start on HA started for entry_id=%s", entry.entry_id)
-                hass.async_create_task(controller.async_post_start())
-            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _on_started)
+    # Post-start hook: schedule exactly once per entry. The entry dict was created above,
+    # so the flag only records that scheduling happened; the bus is touched only before HA runs.
+    domain_store[entry_id]["post_start_scheduled"] = True
+
+    @callback
+    def _start_post_start() -> None:
+        hass.async_create_background_task(
+            controller.async_post_start(), name=f"evcm_post_start_{entry_id}", eager_start=True
+        )
+
+    if hass.is_running:
+        _LOGGER.debug("Scheduling controller.async_post_start immediately (HA is running) for entry_id=%s", entry_id)
+        _start_post_start()
     else:
-        _LOGGER.debug("Post-start already scheduled; skipping duplicate for entry_id=%s", entry.entry_id)
+        cancel_started = None
+
+        @callback
+        def _on_started(_event):
+            nonlocal cancel_started
+            cancel_started = None
+            _LOGGER.debug("Scheduling controller.async_post_start on HA started for entry_id=%s", entry_id)
+            _start_post_start()
+
+        @callback
+        def _cancel_started_listener() -> None:
+            # A fired once-listener is already gone; removing it again would log an error
+            if cancel_started is not None:
+                cancel_started()
+
+        cancel_started = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _on_started)
+        entry.async_on_unload(_cancel_started_listener)
 
     # Register update listener after platforms are ready
     entry.async_on_unload(entry.add_update_listener(_update_listener))
 
-    await async_cleanup_priority_if_removed(hass)
-    _LOGGER.debug("EVCM: async_setup_entry completed for entry_id=%s", entry.entry_id)
+    # Priority store cleanup does not gate this entry; keep it off the setup await chain
+    hass.async_create_background_task(
+        async_cleanup_priority_if_removed(hass), name="evcm_priority_cleanup"
+    )
+    _LOGGER.debug("EVCM: async_setup_entry completed for entry_id=%s", entry_id)
     return True
 
 
+@callback
+def _forget_entry(hass: HomeAssistant, entry_id: str) -> None:
+    """Drop an entry from the domain store and migrate the priority anchor.
+
+    Runs without awaiting, so the whole bookkeeping update is a single critical
+    section on the event loop and concurrent unloads cannot interleave here.
+    """
+    root = hass.data.get(DOMAIN)
+    if root is None:
+        return
+    root.pop(entry_id, None)
+
+    remaining_entry_ids = root.get("_entry_ids", set())
+    remaining_entry_ids.discard(entry_id)
+
+    if not remaining_entry_ids:
+        for internal_key in _INTERNAL_KEYS:
+            root.pop(internal_key, None)
+        if not root:
+            hass.data.pop(DOMAIN, None)
+        return
+
+    if root.get("_priority_anchor_entry_id") == entry_id:
+        new_anchor = min(remaining_entry_ids)
+        root["_priority_anchor_entry_id"] = new_anchor
+        hass.bus.async_fire("evcm_priority_anchor_changed", {"new_anchor_entry_id": new_anchor})
+        _LOGGER.debug("Priority anchor migrated to %s", new_anchor)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    _LOGGER.debug("EVCM: async_unload_entry starting for entry_id=%s", entry.entry_id)
-    data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
-    controller = data.get("controller") if data else None
+    entry_id = entry.entry_id
+    _LOGGER.debug("EVCM: async_unload_entry starting for entry_id=%s", entry_id)
+    root = hass.data.get(DOMAIN, {})
+    data = root.get(entry_id)
+    if data is None:
+        _LOGGER.debug("EVCM: nothing to unload for entry_id=%s", entry_id)
+        return True
+    controller = data.get("controller")
 
     unload_ok = True
     try:
         unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-        _LOGGER.debug("Platform unload result for entry_id=%s: %s", entry.entry_id, unload_ok)
+        _LOGGER.debug("Platform unload result for entry_id=%s: %s", entry_id, unload_ok)
     except Exception as exc:
         _LOGGER.warning("Platform unload failed: %s", exc, exc_info=True)
         unload_ok = False
@@ -130,59 +196,34 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         except Exception as exc:
             _LOGGER.debug("Controller shutdown raised: %s", exc, exc_info=True)
 
-    root = hass.data.get(DOMAIN, {})
-    if entry.entry_id in root:
-        root.pop(entry.entry_id, None)
-
-    def _is_entry_dict(v):
-        return isinstance(v, dict) and "controller" in v
-
-    remaining_entry_dicts = [k for k, v in root.items() if _is_entry_dict(v)]
-
-    anchor_removed = root.get("_priority_anchor_entry_id") == entry.entry_id
-
-    if anchor_removed and remaining_entry_dicts:
-        new_anchor = sorted(remaining_entry_dicts)[0]
-        root["_priority_anchor_entry_id"] = new_anchor
-        hass.bus.async_fire("evcm_priority_anchor_changed", {"new_anchor_entry_id": new_anchor})
-        _LOGGER.debug("Priority anchor migrated to %s", new_anchor)
-    elif anchor_removed and not remaining_entry_dicts:
-        root.pop("_priority_anchor_entry_id", None)
-
-    if not remaining_entry_dicts:
-        for internal_key in list(root.keys()):
-            if internal_key.startswith("_"):
-                root.pop(internal_key, None)
-
-    if not root:
-        hass.data.pop(DOMAIN, None)
+    _forget_entry(hass, entry_id)
 
     await async_cleanup_priority_if_removed(hass)
-    _LOGGER.debug("EVCM: async_unload_entry completed for entry_id=%s", entry.entry_id)
+    _LOGGER.debug("EVCM: async_unload_entry completed for entry_id=%s", entry_id)
     return unload_ok
 
 
 async def _update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    _LOGGER.debug("EVCM: options updated for entry_id=%s", entry.entry_id)
-    domain_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
-    if not domain_data:
-        _LOGGER.debug("EVCM: domain_data missing, reloading entry_id=%s", entry.entry_id)
-        await hass.config_entries.async_reload(entry.entry_id)
-        return
-
-    prev_opts = dict(domain_data.get("last_options", {}))
-    curr_opts = dict(entry.options)
-
-    def strip_ignored(d: dict) -> dict:
-        return {k: v for k, v in d.items() if k not in IGNORED_OPTION_KEYS}
-
-    if strip_ignored(prev_opts) == strip_ignored(curr_opts):
-        domain_data["last_options"] = curr_opts
-        _LOGGER.debug("EVCM: no effective option changes (ignored keys excluded) for entry_id=%s", entry.entry_id)
-        return
-
-    domain_data["last_options"] = curr_opts
-    _LOGGER.debug("EVCM: effective option changes detected; reloading entry_id=%s", entry.entry_id)
-    await hass.config_entries.async_reload(entry.entry_id)
+    # Keep the no-op path free of awaits so the listener completes in a single step;
+    # the reload is the only suspension point. Runs on every options save (planner edits etc.),
+    # so debug logging is checked once rather than per call.
+    entry_id = entry.entry_id
+    debug = _LOGGER.isEnabledFor(logging.DEBUG)
+    if debug:
+        _LOGGER.debug("EVCM: options updated for entry_id=%s", entry_id)
+    domain_data = hass.data.get(DOMAIN, {}).get(entry_id)
+    if domain_data:
+        fingerprint = _options_fingerprint(entry.options)
+        if fingerprint == domain_data.get("last_fingerprint"):
+            if debug:
+                _LOGGER.debug("EVCM: no effective option changes (ignored keys excluded) for entry_id=%s", entry_id)
+            return
+        domain_data["last_fingerprint"] = fingerprint
+        if debug:
+            _LOGGER.debug("EVCM: effective option changes detected; reloading entry_id=%s", entry_id)
+    elif debug:
+        _LOGGER.debug("EVCM: domain_data missing, reloading entry_id=%s", entry_id)
+
+    await hass.config_entries.async_reload(entry_id)
 
 # EOF
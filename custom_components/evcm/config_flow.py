@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import re
+from collections import ChainMap
+from functools import lru_cache
+
 import voluptuous as vol
-from typing import Optional, Dict, List, Tuple
+from typing import Callable, Optional, Dict, List, Tuple
 import logging
 
 from homeassistant import config_entries
@@ -25,6 +29,7 @@ from .const import (
     CONF_WALLBOX_THREE_PHASE,
     CONF_SUPPLY_PROFILE,
     SUPPLY_PROFILES,
+    SUPPLY_PROFILE_IDS,
     CONF_ECO_ON_UPPER,
     CONF_ECO_ON_LOWER,
     CONF_ECO_OFF_UPPER,
@@ -68,18 +73,84 @@ from .const import (
     PHASE_CONTROL_INTEGRATION,
     PHASE_CONTROL_WALLBOX,
     DEFAULT_PHASE_SWITCH_CONTROL_MODE,
+    CONF_UPPER_DEBOUNCE_SECONDS,
+    DEFAULT_UPPER_DEBOUNCE_SECONDS,
+    UPPER_DEBOUNCE_MIN_SECONDS,
+    UPPER_DEBOUNCE_MAX_SECONDS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-CONF_UPPER_DEBOUNCE_SECONDS = "upper_debounce_seconds"
-DEFAULT_UPPER_DEBOUNCE_SECONDS = 3
-UPPER_DEBOUNCE_MIN_SECONDS = 0
-UPPER_DEBOUNCE_MAX_SECONDS = 60
+# Static selectors shared by every form render. Building a selector validates its config,
+# so these are constructed once at import; only defaults and device filters vary per render.
+_SUPPLY_PROFILE_OPTIONS = [{"value": pid, "label": SUPPLY_PROFILES[pid].label} for pid in SUPPLY_PROFILE_IDS]
+_SEL_SUPPLY_PROFILE = selector({"select": {"options": _SUPPLY_PROFILE_OPTIONS}})
+_SEL_BOOLEAN = selector({"boolean": {}})
+_SEL_SENSOR_ENTITY = selector({"entity": {"domain": "sensor"}})
+_SEL_PHASE_CONTROL_MODE = selector({
+    "select": {
+        "options": [
+            {"value": PHASE_CONTROL_INTEGRATION, "label": "Integration controlled"},
+            {"value": PHASE_CONTROL_WALLBOX, "label": "Wallbox controlled"},
+        ]
+    }
+})
+_SEL_PHASE_FEEDBACK_ENTITY = selector({"entity": {"domain": ["sensor", "input_select"]}})
+_SEL_NUM_W = selector({
+    "number": {
+        "min": MIN_THRESHOLD_VALUE,
+        "max": MAX_THRESHOLD_VALUE,
+        "step": 100,
+        "mode": "box",
+        "unit_of_measurement": "W",
+    }
+})
+_SEL_NUM_SUSTAIN_S = selector({
+    "number": {
+        "min": SUSTAIN_MIN_SECONDS,
+        "max": SUSTAIN_MAX_SECONDS,
+        "step": 1,
+        "mode": "box",
+        "unit_of_measurement": "s",
+    }
+})
+_SEL_NUM_CURRENT_A = selector({
+    "number": {
+        "min": ABS_MIN_CURRENT_A,
+        "max": ABS_MAX_CURRENT_A,
+        "step": 1,
+        "mode": "box",
+        "unit_of_measurement": "A",
+    }
+})
+_SEL_NUM_UPPER_DEBOUNCE_S = selector({
+    "number": {
+        "min": UPPER_DEBOUNCE_MIN_SECONDS,
+        "max": UPPER_DEBOUNCE_MAX_SECONDS,
+        "step": 1,
+        "mode": "box",
+        "unit_of_measurement": "s",
+    }
+})
+# Auto phase switching (v1)
+_SEL_NUM_AUTO_DELAY_MIN = selector({
+    "number": {
+        "min": AUTO_PHASE_SWITCH_DELAY_MIN_MIN,
+        "max": AUTO_PHASE_SWITCH_DELAY_MIN_MAX,
+        "step": 1,
+        "mode": "box",
+        "unit_of_measurement": "min",
+    }
+})
+
+
+def _merged(entry: config_entries.ConfigEntry) -> ChainMap:
+    # Read-only view; options take precedence over data without copying either
+    return ChainMap(entry.options, entry.data)
 
 
-def _merged(entry: config_entries.ConfigEntry) -> dict:
-    return {**entry.data, **entry.options}
+_THOUSANDS_SEP_TRANS = str.maketrans("", "", "., ")
+_PLAIN_INT_RE = re.compile(r"-?\d+")
 
 
 def _normalize_number(raw) -> float:
@@ -91,53 +162,89 @@ def _normalize_number(raw) -> float:
     if not s:
         raise ValueError("empty")
     s = s.replace("−", "-")
-    tmp = s.replace(".", "").replace(",", "").replace(" ", "")
-    if tmp and ((tmp.startswith("-") and tmp[1:].isdigit()) or tmp.isdigit()):
+    # Digits with thousands separators ("1.500", "-2,000", "3 000") collapse to a plain integer
+    tmp = s.translate(_THOUSANDS_SEP_TRANS)
+    if _PLAIN_INT_RE.fullmatch(tmp):
         s = tmp
     return float(s)
 
 
+@lru_cache(maxsize=16)
+def _profile_bundle(profile_key: str) -> Tuple[bool, float]:
+    """Return (three_phase, band_min) for a supply profile key."""
+    profile_meta = SUPPLY_PROFILES.get(profile_key, SUPPLY_PROFILES["eu_1ph_230"])
+    three_phase = profile_meta.phases == 3
+    band_min = SUPPLY_PROFILE_MIN_BAND.get(profile_key)
+    if band_min is None:
+        band_min = MIN_BAND_400 if three_phase else MIN_BAND_230
+    return three_phase, band_min
+
+
+_THRESHOLD_KEYS = (CONF_ECO_ON_UPPER, CONF_ECO_ON_LOWER, CONF_ECO_OFF_UPPER, CONF_ECO_OFF_LOWER)
+
+
 def _validate_thresholds(data: dict, band_min: float) -> dict[str, str]:
     errors: dict[str, str] = {}
-    try:
-        on_up = _normalize_number(data.get(CONF_ECO_ON_UPPER))
-        on_lo = _normalize_number(data.get(CONF_ECO_ON_LOWER))
-        off_up = _normalize_number(data.get(CONF_ECO_OFF_UPPER))
-        off_lo = _normalize_number(data.get(CONF_ECO_OFF_LOWER))
-    except Exception:
-        for k in (CONF_ECO_ON_UPPER, CONF_ECO_ON_LOWER, CONF_ECO_OFF_UPPER, CONF_ECO_OFF_LOWER):
-            errors[k] = "value_out_of_range"
-        return errors
-
-    def in_range(v: float) -> bool:
-        return MIN_THRESHOLD_VALUE <= v <= MAX_THRESHOLD_VALUE
-
-    for k, v in [
-        (CONF_ECO_ON_UPPER, on_up),
-        (CONF_ECO_ON_LOWER, on_lo),
-        (CONF_ECO_OFF_UPPER, off_up),
-        (CONF_ECO_OFF_LOWER, off_lo),
-    ]:
-        if not in_range(v):
+    # Parse each field on its own so one typo only flags that field
+    values: dict[str, Optional[float]] = {}
+    for k in _THRESHOLD_KEYS:
+        try:
+            v = _normalize_number(data.get(k))
+        except Exception:
+            v = None
+        if v is None or not (MIN_THRESHOLD_VALUE <= v <= MAX_THRESHOLD_VALUE):
             errors[k] = "value_out_of_range"
+        values[k] = v
+    on_up, on_lo, off_up, off_lo = (values[k] for k in _THRESHOLD_KEYS)
 
-    if (on_up - on_lo) < band_min:
-        errors[CONF_ECO_ON_UPPER] = "eco_on_band_small"
-    if (off_up - off_lo) < band_min:
-        errors[CONF_ECO_OFF_UPPER] = "eco_off_band_small"
+    if on_up is not None and on_lo is not None:
+        if (on_up - on_lo) < band_min:
+            errors[CONF_ECO_ON_UPPER] = "eco_on_band_small"
+    if off_up is not None and off_lo is not None:
+        if (off_up - off_lo) < band_min:
+            errors[CONF_ECO_OFF_UPPER] = "eco_off_band_small"
 
-    if on_up <= off_up:
+    if on_up is not None and off_up is not None and on_up <= off_up:
         errors[CONF_ECO_ON_UPPER] = "must_exceed_off_upper"
-    if on_lo <= off_lo:
+    if on_lo is not None and off_lo is not None and on_lo <= off_lo:
         errors[CONF_ECO_ON_LOWER] = "must_exceed_off_lower"
 
-    if on_lo >= on_up:
+    if on_up is not None and on_lo is not None and on_lo >= on_up:
         errors[CONF_ECO_ON_LOWER] = "lower_above_upper"
-    if off_lo >= off_up:
+    if off_up is not None and off_lo is not None and off_lo >= off_up:
         errors[CONF_ECO_OFF_LOWER] = "lower_above_upper"
     return errors
 
 
+# (key, min, max or None, default) for integer fields validated on the sensors step
+_INT_RANGE_CHECKS: Tuple[Tuple[str, int, Optional[int], int], ...] = (
+    (CONF_SCAN_INTERVAL, MIN_SCAN_INTERVAL, None, DEFAULT_SCAN_INTERVAL),
+    (CONF_SUSTAIN_SECONDS, SUSTAIN_MIN_SECONDS, SUSTAIN_MAX_SECONDS, DEFAULT_SUSTAIN_SECONDS),
+    (CONF_UPPER_DEBOUNCE_SECONDS, UPPER_DEBOUNCE_MIN_SECONDS, UPPER_DEBOUNCE_MAX_SECONDS, DEFAULT_UPPER_DEBOUNCE_SECONDS),
+    (CONF_MAX_CURRENT_LIMIT_A, ABS_MIN_CURRENT_A, ABS_MAX_CURRENT_A, 16),
+)
+_AUTO_DELAY_RANGE_CHECKS: Tuple[Tuple[str, int, Optional[int], int], ...] = (
+    (
+        CONF_AUTO_PHASE_SWITCH_DELAY_MIN,
+        AUTO_PHASE_SWITCH_DELAY_MIN_MIN,
+        AUTO_PHASE_SWITCH_DELAY_MIN_MAX,
+        DEFAULT_AUTO_PHASE_SWITCH_DELAY_MIN,
+    ),
+)
+
+
+def _validate_int_ranges(values: dict, checks, errors: dict[str, str]) -> None:
+    get = values.get
+    for key, lo, hi, default in checks:
+        try:
+            v = int(get(key, default))
+        except Exception:
+            errors[key] = "value_out_of_range"
+            continue
+        if v < lo or (hi is not None and v > hi):
+            errors[key] = "value_out_of_range"
+
+
 KEY_DOMAIN_MAP: Dict[str, str] = {
     CONF_CHARGE_POWER: "sensor",
     CONF_WALLBOX_STATUS: "sensor",
@@ -147,6 +254,8 @@ KEY_DOMAIN_MAP: Dict[str, str] = {
     CONF_CURRENT_SETTING: "number",
 }
 FILTERABLE_KEYS = set(KEY_DOMAIN_MAP.keys())
+# Ordered (key, domain) pairs; fixes the field order of the wallbox entity selectors
+_WALLBOX_ENTITY_ITEMS: Tuple[Tuple[str, str], ...] = tuple(KEY_DOMAIN_MAP.items())
 
 
 def _build_sensors_schema(
@@ -158,105 +267,43 @@ def _build_sensors_schema(
     supply_profile: str = "eu_1ph_230",
     phase_switch_supported: bool = False,
     phase_switch_control_mode: str = DEFAULT_PHASE_SWITCH_CONTROL_MODE,
+    device_entities_by_domain: Optional[Dict[str, List[str]]] = None,
 ) -> vol.Schema:
     if not isinstance(defaults, dict):
         defaults = {}
-
-    num_sel_w = {
-        "number": {
-            "min": MIN_THRESHOLD_VALUE,
-            "max": MAX_THRESHOLD_VALUE,
-            "step": 100,
-            "mode": "box",
-            "unit_of_measurement": "W",
-        }
-    }
-    num_sel_s = {
-        "number": {
-            "min": SUSTAIN_MIN_SECONDS,
-            "max": SUSTAIN_MAX_SECONDS,
-            "step": 1,
-            "mode": "box",
-            "unit_of_measurement": "s",
-        }
-    }
-    num_sel_a = {
-        "number": {
-            "min": ABS_MIN_CURRENT_A,
-            "max": ABS_MAX_CURRENT_A,
-            "step": 1,
-            "mode": "box",
-            "unit_of_measurement": "A",
-        }
-    }
-    num_sel_upper_debounce = {
-        "number": {
-            "min": UPPER_DEBOUNCE_MIN_SECONDS,
-            "max": UPPER_DEBOUNCE_MAX_SECONDS,
-            "step": 1,
-            "mode": "box",
-            "unit_of_measurement": "s",
-        }
-    }
-
-    # ---- Auto phase switching (v1) selector ----
-    num_sel_auto_delay_min = {
-        "number": {
-            "min": AUTO_PHASE_SWITCH_DELAY_MIN_MIN,
-            "max": AUTO_PHASE_SWITCH_DELAY_MIN_MAX,
-            "step": 1,
-            "mode": "box",
-            "unit_of_measurement": "min",
-        }
-    }
+    if selected_device and device_entities_by_domain is None:
+        device_entities_by_domain = _device_entities_by_domain(hass, selected_device)
 
     fields: dict = {}
 
     if grid_single:
-        fields[vol.Required(CONF_GRID_POWER, default=defaults.get(CONF_GRID_POWER, ""))] = selector(
-            {"entity": {"domain": "sensor"}}
-        )
+        fields[vol.Required(CONF_GRID_POWER, default=defaults.get(CONF_GRID_POWER, ""))] = _SEL_SENSOR_ENTITY
     else:
-        fields[vol.Required(CONF_GRID_IMPORT, default=defaults.get(CONF_GRID_IMPORT, ""))] = selector(
-            {"entity": {"domain": "sensor"}}
-        )
-        fields[vol.Required(CONF_GRID_EXPORT, default=defaults.get(CONF_GRID_EXPORT, ""))] = selector(
-            {"entity": {"domain": "sensor"}}
-        )
-
-    def add_ent(key: str, domain: str, filterable: bool = True):
-        ent_selector: Dict = {"entity": {}}
-        if selected_device and filterable and (filter_keys is None or key in filter_keys):
-            candidates = _find_device_candidates(hass, selected_device, domain)
-            if candidates:
-                ent_selector["entity"]["include_entities"] = candidates
-            else:
-                ent_selector["entity"]["domain"] = domain
+        fields[vol.Required(CONF_GRID_IMPORT, default=defaults.get(CONF_GRID_IMPORT, ""))] = _SEL_SENSOR_ENTITY
+        fields[vol.Required(CONF_GRID_EXPORT, default=defaults.get(CONF_GRID_EXPORT, ""))] = _SEL_SENSOR_ENTITY
+
+    for key, domain in _WALLBOX_ENTITY_ITEMS:
+        candidates = None
+        if selected_device and (filter_keys is None or key in filter_keys):
+            candidates = device_entities_by_domain.get(domain)
+        if candidates:
+            ent_config = {"include_entities": list(candidates)}
         else:
-            ent_selector["entity"]["domain"] = domain
-        fields[vol.Required(key, default=defaults.get(key, ""))] = selector(ent_selector)
-
-    add_ent(CONF_CHARGE_POWER, "sensor", filterable=True)
-    add_ent(CONF_WALLBOX_STATUS, "sensor", filterable=True)
-    add_ent(CONF_CABLE_CONNECTED, "binary_sensor", filterable=True)
-    add_ent(CONF_CHARGING_ENABLE, "switch", filterable=True)
-    add_ent(CONF_LOCK_SENSOR, "lock", filterable=True)
-    add_ent(CONF_CURRENT_SETTING, "number", filterable=True)
+            ent_config = {"domain": domain}
+        fields[vol.Required(key, default=defaults.get(key, ""))] = selector({"entity": ent_config})
 
     evsoc_default = defaults.get(CONF_EV_BATTERY_LEVEL, "")
     if evsoc_default:
-        fields[vol.Optional(CONF_EV_BATTERY_LEVEL, default=evsoc_default)] = selector(
-            {"entity": {"domain": "sensor"}}
-        )
+        fields[vol.Optional(CONF_EV_BATTERY_LEVEL, default=evsoc_default)] = _SEL_SENSOR_ENTITY
     else:
-        fields[vol.Optional(CONF_EV_BATTERY_LEVEL)] = selector({"entity": {"domain": "sensor"}})
+        fields[vol.Optional(CONF_EV_BATTERY_LEVEL)] = _SEL_SENSOR_ENTITY
 
-    fields[vol.Required(CONF_MAX_CURRENT_LIMIT_A, default=defaults.get(CONF_MAX_CURRENT_LIMIT_A, 16))] = selector(num_sel_a)
+    fields[vol.Required(CONF_MAX_CURRENT_LIMIT_A, default=defaults.get(CONF_MAX_CURRENT_LIMIT_A, 16))] = _SEL_NUM_CURRENT_A
 
-    fields[vol.Required(CONF_ECO_ON_UPPER, default=defaults.get(CONF_ECO_ON_UPPER, DEFAULT_ECO_ON_UPPER))] = selector(num_sel_w)
-    fields[vol.Required(CONF_ECO_ON_LOWER, default=defaults.get(CONF_ECO_ON_LOWER, DEFAULT_ECO_ON_LOWER))] = selector(num_sel_w)
-    fields[vol.Required(CONF_ECO_OFF_UPPER, default=defaults.get(CONF_ECO_OFF_UPPER, DEFAULT_ECO_OFF_UPPER))] = selector(num_sel_w)
-    fields[vol.Required(CONF_ECO_OFF_LOWER, default=defaults.get(CONF_ECO_OFF_LOWER, DEFAULT_ECO_OFF_LOWER))] = selector(num_sel_w)
+    fields[vol.Required(CONF_ECO_ON_UPPER, default=defaults.get(CONF_ECO_ON_UPPER, DEFAULT_ECO_ON_UPPER))] = _SEL_NUM_W
+    fields[vol.Required(CONF_ECO_ON_LOWER, default=defaults.get(CONF_ECO_ON_LOWER, DEFAULT_ECO_ON_LOWER))] = _SEL_NUM_W
+    fields[vol.Required(CONF_ECO_OFF_UPPER, default=defaults.get(CONF_ECO_OFF_UPPER, DEFAULT_ECO_OFF_UPPER))] = _SEL_NUM_W
+    fields[vol.Required(CONF_ECO_OFF_LOWER, default=defaults.get(CONF_ECO_OFF_LOWER, DEFAULT_ECO_OFF_LOWER))] = _SEL_NUM_W
 
     # ---- Phase switching (EUprofile-only v1) ----
     if supply_profile == "eu_3ph_400" and phase_switch_supported:
@@ -266,14 +313,7 @@ def _build_sensors_schema(
                 CONF_PHASE_SWITCH_CONTROL_MODE,
                 default=defaults.get(CONF_PHASE_SWITCH_CONTROL_MODE, DEFAULT_PHASE_SWITCH_CONTROL_MODE),
             )
-        ] = selector({
-            "select": {
-                "options": [
-                    {"value": PHASE_CONTROL_INTEGRATION, "label": "Integration controlled"},
-                    {"value": PHASE_CONTROL_WALLBOX, "label": "Wallbox controlled"},
-                ]
-            }
-        })
+        ] = _SEL_PHASE_CONTROL_MODE
 
         # Phase mode feedback sensor (required for both modes)
         fields[
@@ -281,13 +321,13 @@ def _build_sensors_schema(
                 CONF_PHASE_MODE_FEEDBACK_SENSOR,
                 default=defaults.get(CONF_PHASE_MODE_FEEDBACK_SENSOR, ""),
             )
-        ] = selector({"entity": {"domain": ["sensor", "input_select"]}})
+        ] = _SEL_PHASE_FEEDBACK_ENTITY
 
         # ALT thresholds (required for both modes since wallbox can switch to either)
-        fields[vol.Required(CONF_ECO_ON_UPPER_ALT, default=defaults.get(CONF_ECO_ON_UPPER_ALT, DEFAULT_ECO_ON_UPPER_ALT))] = selector(num_sel_w)
-        fields[vol.Required(CONF_ECO_ON_LOWER_ALT, default=defaults.get(CONF_ECO_ON_LOWER_ALT, DEFAULT_ECO_ON_LOWER_ALT))] = selector(num_sel_w)
-        fields[vol.Required(CONF_ECO_OFF_UPPER_ALT, default=defaults.get(CONF_ECO_OFF_UPPER_ALT, DEFAULT_ECO_OFF_UPPER_ALT))] = selector(num_sel_w)
-        fields[vol.Required(CONF_ECO_OFF_LOWER_ALT, default=defaults.get(CONF_ECO_OFF_LOWER_ALT, DEFAULT_ECO_OFF_LOWER_ALT))] = selector(num_sel_w)
+        fields[vol.Required(CONF_ECO_ON_UPPER_ALT, default=defaults.get(CONF_ECO_ON_UPPER_ALT, DEFAULT_ECO_ON_UPPER_ALT))] = _SEL_NUM_W
+        fields[vol.Required(CONF_ECO_ON_LOWER_ALT, default=defaults.get(CONF_ECO_ON_LOWER_ALT, DEFAULT_ECO_ON_LOWER_ALT))] = _SEL_NUM_W
+        fields[vol.Required(CONF_ECO_OFF_UPPER_ALT, default=defaults.get(CONF_ECO_OFF_UPPER_ALT, DEFAULT_ECO_OFF_UPPER_ALT))] = _SEL_NUM_W
+        fields[vol.Required(CONF_ECO_OFF_LOWER_ALT, default=defaults.get(CONF_ECO_OFF_LOWER_ALT, DEFAULT_ECO_OFF_LOWER_ALT))] = _SEL_NUM_W
 
         # Auto phase switch delay - only for integration controlled mode
         if phase_switch_control_mode == PHASE_CONTROL_INTEGRATION:
@@ -296,7 +336,7 @@ def _build_sensors_schema(
                     CONF_AUTO_PHASE_SWITCH_DELAY_MIN,
                     default=defaults.get(CONF_AUTO_PHASE_SWITCH_DELAY_MIN, DEFAULT_AUTO_PHASE_SWITCH_DELAY_MIN),
                 )
-            ] = selector(num_sel_auto_delay_min)
+            ] = _SEL_NUM_AUTO_DELAY_MIN
 
     fields[vol.Required(CONF_SCAN_INTERVAL, default=defaults.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))] = selector(
         {
@@ -309,8 +349,8 @@ def _build_sensors_schema(
             }
         }
     )
-    fields[vol.Required(CONF_UPPER_DEBOUNCE_SECONDS, default=defaults.get(CONF_UPPER_DEBOUNCE_SECONDS, DEFAULT_UPPER_DEBOUNCE_SECONDS))] = selector(num_sel_upper_debounce)
-    fields[vol.Required(CONF_SUSTAIN_SECONDS, default=defaults.get(CONF_SUSTAIN_SECONDS, DEFAULT_SUSTAIN_SECONDS))] = selector(num_sel_s)
+    fields[vol.Required(CONF_UPPER_DEBOUNCE_SECONDS, default=defaults.get(CONF_UPPER_DEBOUNCE_SECONDS, DEFAULT_UPPER_DEBOUNCE_SECONDS))] = _SEL_NUM_UPPER_DEBOUNCE_S
+    fields[vol.Required(CONF_SUSTAIN_SECONDS, default=defaults.get(CONF_SUSTAIN_SECONDS, DEFAULT_SUSTAIN_SECONDS))] = _SEL_NUM_SUSTAIN_S
 
     # Auto phase switch delay at the end if not already added (for non-phase-switch configs)
     if CONF_AUTO_PHASE_SWITCH_DELAY_MIN not in [k.schema for k in fields.keys() if hasattr(k, 'schema')]:
@@ -325,139 +365,183 @@ def _build_sensors_schema(
                     CONF_AUTO_PHASE_SWITCH_DELAY_MIN,
                     default=defaults.get(CONF_AUTO_PHASE_SWITCH_DELAY_MIN, DEFAULT_AUTO_PHASE_SWITCH_DELAY_MIN),
                 )
-            ] = selector(num_sel_auto_delay_min)
+            ] = _SEL_NUM_AUTO_DELAY_MIN
 
     return vol.Schema(fields)
 
 
-def _get_reg_entry(hass, entity_id: str):
-    try:
-        ent_reg = er.async_get(hass)
-        return ent_reg.async_get(entity_id)
-    except Exception:
-        return None
-
-
-def _get_registry_name(hass, entity_id: str) -> str:
-    try:
-        e = _get_reg_entry(hass, entity_id)
-        if e:
-            return (e.original_name or e.original_device_class or e.unique_id or e.entity_id) or entity_id
-    except Exception:
-        pass
+def _get_registry_name(ent_reg: er.EntityRegistry, entity_id: str) -> str:
+    # Registry lookups are plain dict reads; no exception handling needed
+    e = ent_reg.async_get(entity_id)
+    if e:
+        return e.original_name or e.original_device_class or e.unique_id or entity_id
     return entity_id
 
 
-def _find_device_candidates(hass, device_id: str, domain: str) -> list[str]:
+def _device_entities_by_domain(hass, device_id: Optional[str]) -> Dict[str, List[str]]:
+    """Bucket a device's enabled entities by domain using the registry's device index."""
     if not device_id:
-        return []
+        return {}
     ent_reg = er.async_get(hass)
-    out: list[str] = []
-    for entry in ent_reg.entities.values():
-        try:
-            if entry.device_id != device_id:
-                continue
-            if getattr(entry, "disabled_by", None) is not None:
-                continue
-            edomain = getattr(entry, "domain", None) or entry.entity_id.split(".", 1)[0]
-            if edomain != domain:
-                continue
-            out.append(entry.entity_id)
-        except Exception:
-            continue
-    return out
+    buckets: Dict[str, List[str]] = {}
+    for entry in er.async_entries_for_device(ent_reg, device_id, include_disabled_entities=False):
+        buckets.setdefault(entry.domain, []).append(entry.entity_id)
+    return buckets
+
+
+def _get_device_buckets(
+    hass, cache: Dict[str, Dict[str, List[str]]], device_id: Optional[str]
+) -> Dict[str, List[str]]:
+    if not device_id:
+        return {}
+    buckets = cache.get(device_id)
+    if buckets is None:
+        buckets = cache[device_id] = _device_entities_by_domain(hass, device_id)
+    return buckets
+
+
+# Lowercase keyword sets for auto-fill ranking (+3 include, +1 bonus, -3 exclude per hit)
+_CHARGE_POWER_INCLUDE = (
+    "charge_power", "charging_power", "charger_power", "evse_power", "ev_power", "wallbox_power", "power",
+)
+_CHARGE_POWER_BONUS = ("charge", "charging", "ev", "wallbox", "charger")
+_CHARGE_POWER_EXCLUDE = (
+    "grid", "import", "export", "solar", "pv", "home", "house", "total", "sum", "accumulated",
+    "energy", "session_energy", "l1", "l2", "l3", "phase",
+)
+_WALLBOX_STATUS_INCLUDE = ("status", "charging_status", "ev_status", "wallbox_status", "state")
+_WALLBOX_STATUS_BONUS = ("charge", "charging", "ev", "wallbox")
+
+# State attributes that mark a sensor as a plausible match before keyword ranking
+_POWER_UNITS = frozenset(("W", "kW"))
+_STATUS_DEVICE_CLASSES = frozenset(("enum", "timestamp"))
 
 
 def _prefer_by_keywords(
-    hass,
+    ent_reg: er.EntityRegistry,
     candidates: List[str],
-    include_any: List[str],
-    bonus_any: Optional[List[str]] = None,
-    exclude_any: Optional[List[str]] = None
-) -> Tuple[List[str], Dict[str, int]]:
-    if not candidates:
-        return [], {}
-    bonus_any = bonus_any or []
-    exclude_any = exclude_any or []
-    score_map: Dict[str, int] = {}
+    include_any: Tuple[str, ...],
+    bonus_any: Tuple[str, ...] = (),
+    exclude_any: Tuple[str, ...] = (),
+    name_cache: Optional[Dict[str, str]] = None,
+) -> List[str]:
+    if len(candidates) <= 1:
+        # A single candidate wins regardless of its score
+        return list(candidates)
+    if name_cache is None:
+        name_cache = {}
+    best: List[str] = []
+    max_score = None
     for eid in candidates:
-        name = f"{eid}|{_get_registry_name(hass, eid)}".lower()
-        score = 0
-        for kw in include_any:
-            if kw in name:
-                score += 3
-        for kw in bonus_any:
-            if kw in name:
-                score += 1
-        for kw in exclude_any:
-            if kw in name:
-                score -= 3
-        score_map[eid] = score
-    max_score = max(score_map.values()) if score_map else 0
-    best = [eid for eid, sc in score_map.items() if sc == max_score]
-    return (best if max_score > 0 else candidates), score_map
-
-
-def _refine_candidates_for_key(hass, candidates: List[str], key: str) -> List[str]:
-    if not candidates:
-        return []
-    refined = list(candidates)
-    if key == CONF_CHARGE_POWER:
-        power_like = []
-        for eid in refined:
-            st = hass.states.get(eid)
-            if not st:
-                continue
-            unit = st.attributes.get("unit_of_measurement")
-            dc = st.attributes.get("device_class")
-            if (dc == "power") or (unit in ("W", "kW")):
-                power_like.append(eid)
-        if len(power_like) == 1:
-            return power_like
-        if len(power_like) > 1:
-            refined = power_like
-        refined, _ = _prefer_by_keywords(
-            hass,
-            refined,
-            include_any=["charge_power", "charging_power", "charger_power", "evse_power", "ev_power", "wallbox_power", "power"],
-            bonus_any=["charge", "charging", "ev", "wallbox", "charger"],
-            exclude_any=["grid", "import", "export", "solar", "pv", "home", "house", "total", "sum", "accumulated", "energy", "session_energy", "l1", "l2", "l3", "phase"],
+        name = name_cache.get(eid)
+        if name is None:
+            name = name_cache[eid] = f"{eid}|{_get_registry_name(ent_reg, eid)}".lower()
+        score = (
+            3 * sum(kw in name for kw in include_any)
+            + sum(kw in name for kw in bonus_any)
+            - 3 * sum(kw in name for kw in exclude_any)
         )
-        return refined
+        if max_score is None or score > max_score:
+            best = [eid]
+            max_score = score
+        elif score == max_score:
+            best.append(eid)
+    return best if max_score > 0 else candidates
+
+
+def _refine_charge_power(
+    hass, ent_reg: er.EntityRegistry, refined: List[str], name_cache: Optional[Dict[str, str]]
+) -> List[str]:
+    states_get = hass.states.get
+    power_like = []
+    for eid in refined:
+        st = states_get(eid)
+        if not st:
+            continue
+        attributes_get = st.attributes.get
+        if attributes_get("device_class") == "power" or attributes_get("unit_of_measurement") in _POWER_UNITS:
+            power_like.append(eid)
+    if len(power_like) == 1:
+        return power_like
+    if len(power_like) > 1:
+        refined = power_like
+    return _prefer_by_keywords(
+        ent_reg,
+        refined,
+        include_any=_CHARGE_POWER_INCLUDE,
+        bonus_any=_CHARGE_POWER_BONUS,
+        exclude_any=_CHARGE_POWER_EXCLUDE,
+        name_cache=name_cache,
+    )
 
-    if key == CONF_WALLBOX_STATUS:
-        enum_like = []
-        for eid in refined:
-            st = hass.states.get(eid)
-            if not st:
-                continue
-            if st.attributes.get("device_class") in ("enum", "timestamp"):
-                enum_like.append(eid)
-        if len(enum_like) == 1:
-            return enum_like
-        if len(enum_like) > 1:
-            refined = enum_like
-        refined, _ = _prefer_by_keywords(
-            hass,
-            refined,
-            include_any=["status", "charging_status", "ev_status", "wallbox_status", "state"],
-            bonus_any=["charge", "charging", "ev", "wallbox"],
-        )
-        return refined
 
-    return refined
+def _refine_wallbox_status(
+    hass, ent_reg: er.EntityRegistry, refined: List[str], name_cache: Optional[Dict[str, str]]
+) -> List[str]:
+    states_get = hass.states.get
+    enum_like = []
+    for eid in refined:
+        st = states_get(eid)
+        if not st:
+            continue
+        if st.attributes.get("device_class") in _STATUS_DEVICE_CLASSES:
+            enum_like.append(eid)
+    if len(enum_like) == 1:
+        return enum_like
+    if len(enum_like) > 1:
+        refined = enum_like
+    return _prefer_by_keywords(
+        ent_reg,
+        refined,
+        include_any=_WALLBOX_STATUS_INCLUDE,
+        bonus_any=_WALLBOX_STATUS_BONUS,
+        name_cache=name_cache,
+    )
+
 
+# Per-key refinement rules; keys without an entry keep their candidates as-is
+_REFINERS: Dict[str, Callable[..., List[str]]] = {
+    CONF_CHARGE_POWER: _refine_charge_power,
+    CONF_WALLBOX_STATUS: _refine_wallbox_status,
+}
 
-def _autofill_from_device(hass, defaults: dict, device_id: Optional[str]) -> None:
+
+def _refine_candidates_for_key(
+    hass,
+    ent_reg: er.EntityRegistry,
+    candidates: List[str],
+    key: str,
+    name_cache: Optional[Dict[str, str]] = None,
+) -> List[str]:
+    refined = list(candidates)
+    refiner = _REFINERS.get(key)
+    if refiner is None or len(refined) <= 1:
+        return refined
+    return refiner(hass, ent_reg, refined, name_cache)
+
+
+def _autofill_from_device(
+    hass,
+    defaults: dict,
+    device_id: Optional[str],
+    by_domain: Optional[Dict[str, List[str]]] = None,
+) -> None:
     if not device_id:
         return
-    for key, domain in KEY_DOMAIN_MAP.items():
+    if all(defaults.get(key) for key in KEY_DOMAIN_MAP):
+        return
+    if by_domain is None:
+        by_domain = _device_entities_by_domain(hass, device_id)
+    ent_reg = er.async_get(hass)
+    # Lowercased "entity_id|registry name" per candidate, shared across keys
+    name_cache: Dict[str, str] = {}
+    for key, domain in _WALLBOX_ENTITY_ITEMS:
         if defaults.get(key):
             continue
-        candidates = _find_device_candidates(hass, device_id, domain)
+        candidates = by_domain.get(domain)
         if not candidates:
             continue
-        refined = _refine_candidates_for_key(hass, candidates, key)
+        refined = _refine_candidates_for_key(hass, ent_reg, candidates, key, name_cache)
         if len(refined) == 1:
             defaults[key] = refined[0]
             _LOGGER.debug("Auto-filled %s with %s (from %d candidates)", key, refined[0], len(candidates))
@@ -476,20 +560,19 @@ class EVChargeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._s_defaults: dict | None = None
         self._selected_device: Optional[str] = None
         self._phase_switch_supported_selected: Optional[bool] = None
+        self._autofilled = False
+        self._device_buckets: Dict[str, Dict[str, List[str]]] = {}
+
+    def _device_entities(self) -> Dict[str, List[str]]:
+        """Entities of the selected device bucketed by domain, fetched once per device."""
+        return _get_device_buckets(self.hass, self._device_buckets, self._selected_device)
 
     async def async_step_user(self, user_input=None):
         schema = vol.Schema(
             {
                 vol.Optional(CONF_NAME, default=""): str,
-                vol.Required(CONF_GRID_SINGLE, default=False): selector({"boolean": {}}),
-                vol.Required(CONF_SUPPLY_PROFILE, default="eu_1ph_230"): selector({
-                    "select": {
-                        "options": [
-                            {"value": key, "label": meta["label"]}
-                            for key, meta in SUPPLY_PROFILES.items()
-                        ]
-                    }
-                }),
+                vol.Required(CONF_GRID_SINGLE, default=False): _SEL_BOOLEAN,
+                vol.Required(CONF_SUPPLY_PROFILE, default="eu_1ph_230"): _SEL_SUPPLY_PROFILE,
             }
         )
         if user_input is None:
@@ -547,7 +630,7 @@ class EVChargeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     CONF_PHASE_SWITCH_SUPPORTED,
                     default=bool((self._s_defaults or {}).get(CONF_PHASE_SWITCH_SUPPORTED, False)),
                 )
-            ] = selector({"boolean": {}})
+            ] = _SEL_BOOLEAN
 
         schema = vol.Schema(schema_fields)
 
@@ -555,7 +638,11 @@ class EVChargeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_show_form(step_id="device", data_schema=schema)
 
         device_id = (user_input.get(CONF_DEVICE_ID) or "").strip()
-        self._selected_device = device_id if device_id else None
+        selected_device = device_id if device_id else None
+        if selected_device != self._selected_device:
+            self._autofilled = False
+            self._device_buckets.clear()
+        self._selected_device = selected_device
         self._phase_switch_supported_selected = bool(user_input.get(CONF_PHASE_SWITCH_SUPPORTED, False)) if profile_key == "eu_3ph_400" else False
 
         return await self.async_step_sensors()
@@ -564,8 +651,7 @@ class EVChargeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         assert self._step1 is not None
         grid_single = bool(self._step1.get(CONF_GRID_SINGLE, False))
         profile_key = self._step1.get(CONF_SUPPLY_PROFILE, "eu_1ph_230")
-        profile_meta = SUPPLY_PROFILES.get(profile_key, SUPPLY_PROFILES["eu_1ph_230"])
-        three_phase = bool(profile_meta.get("phases", 1) == 3)
+        three_phase, band_min = _profile_bundle(profile_key)
 
         if self._s_defaults is None:
             self._s_defaults = {}
@@ -576,8 +662,9 @@ class EVChargeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         phase_switch_supported = bool(self._s_defaults.get(CONF_PHASE_SWITCH_SUPPORTED, False))
         phase_switch_control_mode = self._s_defaults.get(CONF_PHASE_SWITCH_CONTROL_MODE, DEFAULT_PHASE_SWITCH_CONTROL_MODE)
 
-        if user_input is None and self._selected_device:
-            _autofill_from_device(self.hass, self._s_defaults, self._selected_device)
+        if user_input is None and self._selected_device and not self._autofilled:
+            _autofill_from_device(self.hass, self._s_defaults, self._selected_device, self._device_entities())
+            self._autofilled = True
 
         if user_input is None:
             try:
@@ -590,6 +677,7 @@ class EVChargeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     supply_profile=profile_key,
                     phase_switch_supported=phase_switch_supported,
                     phase_switch_control_mode=phase_switch_control_mode,
+                    device_entities_by_domain=self._device_entities(),
                 )
                 return self.async_show_form(
                     step_id="sensors",
@@ -614,16 +702,11 @@ class EVChargeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     description_placeholders={"name": self._step1.get(CONF_NAME, "")},
                 )
 
-        for k, v in (user_input or {}).items():
-            self._s_defaults[k] = v
+        self._s_defaults.update(user_input or {})
 
         # Update phase_switch_control_mode from user input
         phase_switch_control_mode = self._s_defaults.get(CONF_PHASE_SWITCH_CONTROL_MODE, DEFAULT_PHASE_SWITCH_CONTROL_MODE)
 
-        band_min = SUPPLY_PROFILE_MIN_BAND.get(profile_key)
-        if band_min is None:
-            band_min = MIN_BAND_400 if three_phase else MIN_BAND_230
-
         thresh_data = {
             CONF_ECO_ON_UPPER: self._s_defaults.get(CONF_ECO_ON_UPPER, DEFAULT_ECO_ON_UPPER),
             CONF_ECO_ON_LOWER: self._s_defaults.get(CONF_ECO_ON_LOWER, DEFAULT_ECO_ON_LOWER),
@@ -652,45 +735,13 @@ class EVChargeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 CONF_ECO_OFF_UPPER: CONF_ECO_OFF_UPPER_ALT,
                 CONF_ECO_OFF_LOWER: CONF_ECO_OFF_LOWER_ALT,
             }
-            for k, v in alt_errors.items():
-                errors[mapping.get(k, k)] = v
+            errors.update((mapping.get(k, k), v) for k, v in alt_errors.items())
 
-        try:
-            si = int(self._s_defaults.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
-            if si < MIN_SCAN_INTERVAL:
-                raise ValueError
-        except Exception:
-            errors[CONF_SCAN_INTERVAL] = "value_out_of_range"
-
-        try:
-            st = int(self._s_defaults.get(CONF_SUSTAIN_SECONDS, DEFAULT_SUSTAIN_SECONDS))
-            if st < SUSTAIN_MIN_SECONDS or st > SUSTAIN_MAX_SECONDS:
-                raise ValueError
-        except Exception:
-            errors[CONF_SUSTAIN_SECONDS] = "value_out_of_range"
-
-        try:
-            ud = int(self._s_defaults.get(CONF_UPPER_DEBOUNCE_SECONDS, DEFAULT_UPPER_DEBOUNCE_SECONDS))
-            if ud < UPPER_DEBOUNCE_MIN_SECONDS or ud > UPPER_DEBOUNCE_MAX_SECONDS:
-                raise ValueError
-        except Exception:
-            errors[CONF_UPPER_DEBOUNCE_SECONDS] = "value_out_of_range"
-
-        try:
-            max_a = int(self._s_defaults.get(CONF_MAX_CURRENT_LIMIT_A, 16))
-            if max_a < ABS_MIN_CURRENT_A or max_a > ABS_MAX_CURRENT_A:
-                raise ValueError
-        except Exception:
-            errors[CONF_MAX_CURRENT_LIMIT_A] = "value_out_of_range"
+        _validate_int_ranges(self._s_defaults, _INT_RANGE_CHECKS, errors)
 
         # Only validate auto delay if integration controlled
         if phase_switch_control_mode == PHASE_CONTROL_INTEGRATION:
-            try:
-                ad = int(self._s_defaults.get(CONF_AUTO_PHASE_SWITCH_DELAY_MIN, DEFAULT_AUTO_PHASE_SWITCH_DELAY_MIN))
-                if ad < AUTO_PHASE_SWITCH_DELAY_MIN_MIN or ad > AUTO_PHASE_SWITCH_DELAY_MIN_MAX:
-                    raise ValueError
-            except Exception:
-                errors[CONF_AUTO_PHASE_SWITCH_DELAY_MIN] = "value_out_of_range"
+            _validate_int_ranges(self._s_defaults, _AUTO_DELAY_RANGE_CHECKS, errors)
 
         if errors:
             try:
@@ -703,6 +754,7 @@ class EVChargeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     supply_profile=profile_key,
                     phase_switch_supported=phase_switch_supported,
                     phase_switch_control_mode=phase_switch_control_mode,
+                    device_entities_by_domain=self._device_entities(),
                 )
             except Exception as exc:
                 _LOGGER.warning("Device-filtered entity selector failed (%s); falling back to unfiltered.", exc)
@@ -731,7 +783,7 @@ class EVChargeManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         else:
             data.pop(CONF_GRID_POWER, None)
 
-        data[CONF_WALLBOX_THREE_PHASE] = bool(profile_meta.get("phases", 1) == 3)
+        data[CONF_WALLBOX_THREE_PHASE] = three_phase
 
         if self._selected_device:
             data[CONF_DEVICE_ID] = self._selected_device
@@ -765,6 +817,12 @@ class EVChargeManagerOptionsFlow(OptionsFlowBase):
         self._values: dict | None = None
         self._selected_device: Optional[str] = None
         self._phase_switch_supported_selected: Optional[bool] = None
+        self._autofilled = False
+        self._device_buckets: Dict[str, Dict[str, List[str]]] = {}
+
+    def _device_entities(self) -> Dict[str, List[str]]:
+        """Entities of the selected device bucketed by domain, fetched once per device."""
+        return _get_device_buckets(self.hass, self._device_buckets, self._selected_device)
 
     async def async_step_init(self, user_input=None):
         eff = _merged(self.config_entry)
@@ -772,15 +830,8 @@ class EVChargeManagerOptionsFlow(OptionsFlowBase):
         current_profile = eff.get(CONF_SUPPLY_PROFILE, "eu_1ph_230")
         schema = vol.Schema(
             {
-                vol.Required(CONF_GRID_SINGLE, default=current_single): selector({"boolean": {}}),
-                vol.Required(CONF_SUPPLY_PROFILE, default=current_profile): selector({
-                    "select": {
-                        "options": [
-                            {"value": key, "label": meta["label"]}
-                            for key, meta in SUPPLY_PROFILES.items()
-                        ]
-                    }
-                }),
+                vol.Required(CONF_GRID_SINGLE, default=current_single): _SEL_BOOLEAN,
+                vol.Required(CONF_SUPPLY_PROFILE, default=current_profile): _SEL_SUPPLY_PROFILE,
             }
         )
         name = eff.get(CONF_NAME) or self.config_entry.title or "EVCM"
@@ -806,7 +857,7 @@ class EVChargeManagerOptionsFlow(OptionsFlowBase):
                     CONF_PHASE_SWITCH_SUPPORTED,
                     default=bool(eff.get(CONF_PHASE_SWITCH_SUPPORTED, False)),
                 )
-            ] = selector({"boolean": {}})
+            ] = _SEL_BOOLEAN
 
         schema = vol.Schema(schema_fields)
 
@@ -815,7 +866,11 @@ class EVChargeManagerOptionsFlow(OptionsFlowBase):
             return self.async_show_form(step_id="device", data_schema=schema, description_placeholders={"name": name})
 
         device_id = (user_input.get(CONF_DEVICE_ID) or "").strip()
-        self._selected_device = device_id if device_id else None
+        selected_device = device_id if device_id else None
+        if selected_device != self._selected_device:
+            self._autofilled = False
+            self._device_buckets.clear()
+        self._selected_device = selected_device
 
         self._phase_switch_supported_selected = (
             bool(user_input.get(CONF_PHASE_SWITCH_SUPPORTED, False)) if profile_key == "eu_3ph_400" else False
@@ -827,8 +882,7 @@ class EVChargeManagerOptionsFlow(OptionsFlowBase):
         eff = _merged(self.config_entry)
         grid_single = self._grid_single if self._grid_single is not None else bool(eff.get(CONF_GRID_SINGLE, False))
         profile_key = self._supply_profile if self._supply_profile is not None else eff.get(CONF_SUPPLY_PROFILE, "eu_1ph_230")
-        profile_meta = SUPPLY_PROFILES.get(profile_key, SUPPLY_PROFILES["eu_1ph_230"])
-        three_phase = bool(profile_meta.get("phases", 1) == 3)
+        three_phase, band_min = _profile_bundle(profile_key)
 
         if self._values is None:
             self._values = {
@@ -867,8 +921,9 @@ class EVChargeManagerOptionsFlow(OptionsFlowBase):
         phase_switch_control_mode = self._values.get(CONF_PHASE_SWITCH_CONTROL_MODE, DEFAULT_PHASE_SWITCH_CONTROL_MODE)
 
         if user_input is None:
-            if self._selected_device:
-                _autofill_from_device(self.hass, self._values, self._selected_device)
+            if self._selected_device and not self._autofilled:
+                _autofill_from_device(self.hass, self._values, self._selected_device, self._device_entities())
+                self._autofilled = True
             try:
                 schema = _build_sensors_schema(
                     self.hass, 
@@ -879,6 +934,7 @@ class EVChargeManagerOptionsFlow(OptionsFlowBase):
                     supply_profile=profile_key,
                     phase_switch_supported=phase_switch_supported,
                     phase_switch_control_mode=phase_switch_control_mode,
+                    device_entities_by_domain=self._device_entities(),
                 )
                 name = eff.get(CONF_NAME) or self.config_entry.title or "EVCM"
                 return self.async_show_form(step_id="sensors", data_schema=schema, description_placeholders={"name": name})
@@ -897,16 +953,11 @@ class EVChargeManagerOptionsFlow(OptionsFlowBase):
                 name = eff.get(CONF_NAME) or self.config_entry.title or "EVCM"
                 return self.async_show_form(step_id="sensors", data_schema=schema, description_placeholders={"name": name})
 
-        for k, v in (user_input or {}).items():
-            self._values[k] = v
+        self._values.update(user_input or {})
 
         # Update phase_switch_control_mode from user input
         phase_switch_control_mode = self._values.get(CONF_PHASE_SWITCH_CONTROL_MODE, DEFAULT_PHASE_SWITCH_CONTROL_MODE)
 
-        band_min = SUPPLY_PROFILE_MIN_BAND.get(profile_key)
-        if band_min is None:
-            band_min = MIN_BAND_400 if three_phase else MIN_BAND_230
-
         thresh_data = {
             CONF_ECO_ON_UPPER: self._values.get(CONF_ECO_ON_UPPER),
             CONF_ECO_ON_LOWER: self._values.get(CONF_ECO_ON_LOWER),
@@ -935,49 +986,19 @@ class EVChargeManagerOptionsFlow(OptionsFlowBase):
                 CONF_ECO_OFF_UPPER: CONF_ECO_OFF_UPPER_ALT,
                 CONF_ECO_OFF_LOWER: CONF_ECO_OFF_LOWER_ALT,
             }
-            for k, v in alt_errors.items():
-                errors[mapping.get(k, k)] = v
+            errors.update((mapping.get(k, k), v) for k, v in alt_errors.items())
 
-        try:
-            si = int(self._values.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
-            if si < MIN_SCAN_INTERVAL:
-                raise ValueError
-        except Exception:
-            errors[CONF_SCAN_INTERVAL] = "value_out_of_range"
-
-        try:
-            st = int(self._values.get(CONF_SUSTAIN_SECONDS, DEFAULT_SUSTAIN_SECONDS))
-            if st < SUSTAIN_MIN_SECONDS or st > SUSTAIN_MAX_SECONDS:
-                raise ValueError
-        except Exception:
-            errors[CONF_SUSTAIN_SECONDS] = "value_out_of_range"
-
-        try:
-            ud = int(self._values.get(CONF_UPPER_DEBOUNCE_SECONDS, DEFAULT_UPPER_DEBOUNCE_SECONDS))
-            if ud < UPPER_DEBOUNCE_MIN_SECONDS or ud > UPPER_DEBOUNCE_MAX_SECONDS:
-                raise ValueError
-        except Exception:
-            errors[CONF_UPPER_DEBOUNCE_SECONDS] = "value_out_of_range"
-
-        try:
-            max_a = int(self._values.get(CONF_MAX_CURRENT_LIMIT_A, 16))
-            if max_a < ABS_MIN_CURRENT_A or max_a > ABS_MAX_CURRENT_A:
-                raise ValueError
-        except Exception:
-            errors[CONF_MAX_CURRENT_LIMIT_A] = "value_out_of_range"
+        _validate_int_ranges(self._values, _INT_RANGE_CHECKS, errors)
 
         # Only validate auto delay if integration controlled
         if phase_switch_control_mode == PHASE_CONTROL_INTEGRATION:
-            try:
-                ad = int(self._values.get(CONF_AUTO_PHASE_SWITCH_DELAY_MIN, DEFAULT_AUTO_PHASE_SWITCH_DELAY_MIN))
-                if ad < AUTO_PHASE_SWITCH_DELAY_MIN_MIN or ad > AUTO_PHASE_SWITCH_DELAY_MIN_MAX:
-                    raise ValueError
-            except Exception:
-                errors[CONF_AUTO_PHASE_SWITCH_DELAY_MIN] = "value_out_of_range"
+            _validate_int_ranges(self._values, _AUTO_DELAY_RANGE_CHECKS, errors)
 
         if errors:
-            if self._selected_device:
-                _autofill_from_device(self.hass, self._values, self._selected_device)
+            # Values were auto-filled on the first render; a retry only re-renders them
+            if self._selected_device and not self._autofilled:
+                _autofill_from_device(self.hass, self._values, self._selected_device, self._device_entities())
+                self._autofilled = True
             try:
                 schema = _build_sensors_schema(
                     self.hass, 
@@ -988,6 +1009,7 @@ class EVChargeManagerOptionsFlow(OptionsFlowBase):
                     supply_profile=profile_key,
                     phase_switch_supported=phase_switch_supported,
                     phase_switch_control_mode=phase_switch_control_mode,
+                    device_entities_by_domain=self._device_entities(),
                 )
             except Exception as exc:
                 _LOGGER.warning("Device-filtered entity selector failed (%s); falling back to unfiltered.", exc)
@@ -1008,13 +1030,12 @@ class EVChargeManagerOptionsFlow(OptionsFlowBase):
         new_opts = dict(self.config_entry.options)
         new_opts[CONF_GRID_SINGLE] = bool(grid_single)
         new_opts[CONF_SUPPLY_PROFILE] = profile_key
-        new_opts[CONF_WALLBOX_THREE_PHASE] = bool(profile_meta.get("phases", 1) == 3)
+        new_opts[CONF_WALLBOX_THREE_PHASE] = three_phase
 
         if self._selected_device:
             new_opts[CONF_DEVICE_ID] = self._selected_device
 
-        for k, v in self._values.items():
-            new_opts[k] = v
+        new_opts.update(self._values)
 
         return self.async_create_entry(title="", data=new_opts)
 
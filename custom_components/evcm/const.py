@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+
 from homeassistant.const import Platform
 
 DOMAIN = "evcm"
 
-PLATFORMS: list[Platform] = [
+PLATFORMS: tuple[Platform, ...] = (
     Platform.SWITCH,
     Platform.DATETIME,
     Platform.NUMBER,
     Platform.SENSOR,
     Platform.SELECT,
-]
+)
 
 # Legacy option keys
 CONF_OPT_MODE_ECO = "mode_eco"
@@ -46,51 +50,58 @@ CONF_SUPPLY_PROFILE = "supply_profile"
 CONF_WALLBOX_THREE_PHASE = "wallbox_three_phase"
 DEFAULT_WALLBOX_THREE_PHASE = False
 
-SUPPLY_PROFILES = {
-    "eu_1ph_230": {
-        "label": "1-phase 230V/240V",
-        "phases": 1,
-        "phase_voltage_v": 230,
-        "min_power_6a_w": int(220 * 6),
-        "regulation_min_w": 1300,
-    },
-    "eu_3ph_400": {
-        "label": "3-phase 400V",
-        "phases": 3,
-        "phase_voltage_v": 230,
-        "min_power_6a_w": int(220 * 6 * 3),
-        "regulation_min_w": 3900,
-    },
-    "na_3ph_208": {
-        "label": "3-phase 208V",
-        "phases": 3,
-        "phase_voltage_v": 120,
-        "min_power_6a_w": int(120 * 6 * 3),
-        "regulation_min_w": 2000,
-    },
-    "jp_1ph_200": {
-        "label": "1-phase 200V",
-        "phases": 1,
-        "phase_voltage_v": 200,
-        "min_power_6a_w": int(200 * 6),
-        "regulation_min_w": 1100,
-    },
-    "na_1ph_120": {
-        "label": "1-phase 120V (Level 1)",
-        "phases": 1,
-        "phase_voltage_v": 120,
-        "min_power_6a_w": int(120 * 6),
-        "regulation_min_w": 650,
-    },
-}
-
-SUPPLY_PROFILE_REG_THRESHOLDS = {
-    "eu_1ph_230": {"export_inc_w": 240, "import_dec_w": 70},
-    "jp_1ph_200": {"export_inc_w": 205, "import_dec_w": 60},
-    "na_1ph_120": {"export_inc_w": 122, "import_dec_w": 35},
-    "na_3ph_208": {"export_inc_w": 370, "import_dec_w": 105},
-    "eu_3ph_400": {"export_inc_w": 700, "import_dec_w": 200},
-}
+
+class SupplyProfile(NamedTuple):
+    """Static electrical parameters of a supply profile."""
+
+    label: str
+    phases: int
+    phase_voltage_v: int
+    min_power_6a_w: int
+    regulation_min_w: int
+
+
+# Regulation minimums of the EU profiles, also used as phase-count fallbacks
+REG_MIN_EU_1P_W = 1300
+REG_MIN_EU_3P_W = 3900
+
+# Lookup tables below are read-only views; callers may hold references without copying
+SUPPLY_PROFILES: Mapping[str, SupplyProfile] = MappingProxyType({
+    "eu_1ph_230": SupplyProfile("1-phase 230V/240V", 1, 230, 220 * 6, REG_MIN_EU_1P_W),
+    "eu_3ph_400": SupplyProfile("3-phase 400V", 3, 230, 220 * 6 * 3, REG_MIN_EU_3P_W),
+    "na_3ph_208": SupplyProfile("3-phase 208V", 3, 120, 120 * 6 * 3, 2000),
+    "jp_1ph_200": SupplyProfile("1-phase 200V", 1, 200, 200 * 6, 1100),
+    "na_1ph_120": SupplyProfile("1-phase 120V (Level 1)", 1, 120, 120 * 6, 650),
+})
+# Profile ids in display order
+SUPPLY_PROFILE_IDS: tuple[str, ...] = tuple(SUPPLY_PROFILES)
+# Retired profile ids and the profile they now load as
+SUPPLY_PROFILE_MIGRATIONS: Mapping[str, str] = MappingProxyType({
+    "na_1ph_240": "eu_1ph_230",
+})
+
+
+def get_profile(profile_id: Optional[str]) -> Optional[SupplyProfile]:
+    """Return the supply profile for an id, or None if unknown."""
+    return SUPPLY_PROFILES.get(profile_id)
+
+
+class RegThresholds(NamedTuple):
+    """Per-profile regulation step thresholds."""
+
+    export_inc_w: int
+    import_dec_w: int
+
+
+SUPPLY_PROFILE_REG_THRESHOLDS: Mapping[str, RegThresholds] = MappingProxyType({
+    "eu_1ph_230": RegThresholds(240, 70),
+    "jp_1ph_200": RegThresholds(205, 60),
+    "na_1ph_120": RegThresholds(122, 35),
+    "na_3ph_208": RegThresholds(370, 105),
+    "eu_3ph_400": RegThresholds(700, 200),
+})
+# Used when the effective profile has no entry
+DEFAULT_REG_THRESHOLDS = RegThresholds(250, 0)
 
 # Modes
 MODE_ECO = "eco"
@@ -99,14 +110,14 @@ MODE_MANUAL_AUTO = "manual"
 MODE_CHARGE_PLANNER = "planner"
 MODE_STARTSTOP_RESET = "startstop_reset"
 
-MODES = [MODE_ECO, MODE_START_STOP, MODE_MANUAL_AUTO, MODE_CHARGE_PLANNER, MODE_STARTSTOP_RESET]
-MODE_LABELS = {
+MODES = (MODE_ECO, MODE_START_STOP, MODE_MANUAL_AUTO, MODE_CHARGE_PLANNER, MODE_STARTSTOP_RESET)
+MODE_LABELS = MappingProxyType({
     MODE_ECO: "ECO",
     MODE_START_STOP: "Start/Stop",
     MODE_MANUAL_AUTO: "Manual",
     MODE_CHARGE_PLANNER: "Planner",
     MODE_STARTSTOP_RESET: "Start/Stop Reset",
-}
+})
 
 # Wallbox status values
 WALLBOX_STATUS_READY = "Ready"
@@ -180,21 +191,61 @@ MIN_BAND_208 = 2600
 MIN_BAND_200 = 1500
 MIN_BAND_120 = 1000
 
-SUPPLY_PROFILE_MIN_BAND = {
+SUPPLY_PROFILE_MIN_BAND = MappingProxyType({
     "eu_1ph_230": MIN_BAND_230,
     "eu_3ph_400": MIN_BAND_400,
     "na_3ph_208": MIN_BAND_208,
     "jp_1ph_200": MIN_BAND_200,
     "na_1ph_120": MIN_BAND_120,
-}
+})
+
+
+class SupplyDerived(NamedTuple):
+    """Per-profile values read together by the controller, fused into one record."""
+
+    phases: int
+    phase_voltage_v: int
+    min_power_6a_w: int
+    regulation_min_w: int
+    band_min_w: int
+    export_inc_w: int
+    import_dec_w: int
+    min_charge_power_w: int
+
+
+SUPPLY_DERIVED: Mapping[str, SupplyDerived] = MappingProxyType({
+    pid: SupplyDerived(
+        prof.phases,
+        prof.phase_voltage_v,
+        prof.min_power_6a_w,
+        prof.regulation_min_w,
+        SUPPLY_PROFILE_MIN_BAND[pid],
+        *SUPPLY_PROFILE_REG_THRESHOLDS[pid],
+        max(
+            prof.min_power_6a_w,
+            MIN_CHARGE_POWER_THREE_PHASE_W if prof.phases == 3 else MIN_CHARGE_POWER_SINGLE_PHASE_W,
+        ),
+    )
+    for pid, prof in SUPPLY_PROFILES.items()
+})
+
+
+def get_profile_derived(profile_id: Optional[str]) -> Optional[SupplyDerived]:
+    """Return the fused per-profile record for an id, or None if unknown."""
+    return SUPPLY_DERIVED.get(profile_id)
+
 
 PLANNER_DATETIME_UPDATED_EVENT = "evcm_planner_datetime_updated"
 
+
 # charging_enable retry (when command has no effect / sticky state)
-CE_ENABLE_RETRY_INTERVAL_S = 60
-CE_ENABLE_MAX_RETRIES = 10
-CE_DISABLE_RETRY_INTERVAL_S = 30
-CE_DISABLE_MAX_RETRIES = 10
+class CERetryPolicy(NamedTuple):
+    interval_s: int
+    max_retries: int
+
+
+CE_ENABLE_RETRY = CERetryPolicy(interval_s=60, max_retries=10)
+CE_DISABLE_RETRY = CERetryPolicy(interval_s=30, max_retries=10)
 
 # External import limit (Max peak avg)
 CONF_EXT_IMPORT_LIMIT_W = "ext_import_limit_w"
@@ -242,6 +293,7 @@ PHASE_SWITCH_MODE_OPTIONS = [
     PHASE_SWITCH_MODE_FORCE_1P,
     PHASE_SWITCH_MODE_FORCE_3P,
 ]
+PHASE_SWITCH_MODE_OPTIONS_SET = frozenset(PHASE_SWITCH_MODE_OPTIONS)  # membership; keep the list for UI order
 
 # Phase switching request throttling (no-queue)
 PHASE_SWITCH_COOLDOWN_SECONDS = 300
@@ -276,6 +328,7 @@ UNKNOWN_DEBOUNCE_SECONDS = 30.0
 UNKNOWN_STARTUP_GRACE_SECONDS = 15.0
 
 # Upper debounce defaults
+CONF_UPPER_DEBOUNCE_SECONDS = "upper_debounce_seconds"
 DEFAULT_UPPER_DEBOUNCE_SECONDS = 3
 UPPER_DEBOUNCE_MIN_SECONDS = 0
 UPPER_DEBOUNCE_MAX_SECONDS = 60
@@ -314,11 +367,16 @@ REGULATION_MIN_POWER_CHECK_DELAY_S = 1.0
 # Priority polling
 PRIORITY_REFRESH_POLL_INTERVAL_S = 0.25
 PRIORITY_REFRESH_RETRIES = 4
+# Priority mode flag is pushed via on_global_priority_changed; re-read at most this often on start checks
+PRIORITY_MODE_FLAG_TTL_S = 1.0
 OTHER_CHARGING_CHECK_RETRIES = 8
 OTHER_CHARGING_CHECK_INTERVAL_S = 0.25
 
 # Verify delays
 CE_VERIFY_DELAY_S = 1.0
 
+# Shutdown: upper bound on waiting for cancelled tasks to unwind
+SHUTDOWN_TASK_DRAIN_TIMEOUT_S = 5.0
+
 
 # EOF
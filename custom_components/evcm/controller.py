@@ -4,8 +4,10 @@ import asyncio
 import contextlib
 import logging
 import time
+from collections.abc import Mapping
 from datetime import datetime, timedelta
-from typing import Optional, Callable, Dict, List, Tuple
+from types import MappingProxyType
+from typing import Any, Optional, Callable, Dict, List, Tuple
 
 from homeassistant.core import HomeAssistant, callback, Event
 from homeassistant.config_entries import ConfigEntry
@@ -15,6 +17,7 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.const import STATE_ON, STATE_OFF, EVENT_HOMEASSISTANT_STARTED
 from homeassistant.util import dt as dt_util
+from homeassistant.util.async_ import create_eager_task
 from homeassistant.helpers.storage import Store
 
 from .const import (
@@ -61,8 +64,13 @@ from .const import (
     CONF_MAX_CURRENT_LIMIT_A,
     CONF_SUPPLY_PROFILE,
     SUPPLY_PROFILES,
-    SUPPLY_PROFILE_REG_THRESHOLDS,
-    SUPPLY_PROFILE_MIN_BAND,
+    DEFAULT_REG_THRESHOLDS,
+    SupplyDerived,
+    REG_MIN_EU_1P_W,
+    REG_MIN_EU_3P_W,
+    get_profile_derived,
+    get_profile,
+    SUPPLY_PROFILE_MIGRATIONS,
     MIN_BAND_230,
     MIN_BAND_400,
     CONF_NET_POWER_TARGET_W,
@@ -104,10 +112,8 @@ from .const import (
     AUTO_PHASE_SWITCH_DELAY_MIN_MIN,
     AUTO_PHASE_SWITCH_DELAY_MIN_MAX,
     DEFAULT_AUTO_PHASE_SWITCH_DELAY_MIN,
-    CE_ENABLE_RETRY_INTERVAL_S,
-    CE_ENABLE_MAX_RETRIES,
-    CE_DISABLE_RETRY_INTERVAL_S,
-    CE_DISABLE_MAX_RETRIES,
+    CE_ENABLE_RETRY,
+    CE_DISABLE_RETRY,
     CONNECT_DEBOUNCE_SECONDS,
     EXPORT_SUSTAIN_SECONDS,
     PLANNER_MONITOR_INTERVAL_S,
@@ -115,6 +121,7 @@ from .const import (
     MIN_CURRENT_A,
     UNKNOWN_DEBOUNCE_SECONDS,
     UNKNOWN_STARTUP_GRACE_SECONDS,
+    CONF_UPPER_DEBOUNCE_SECONDS,
     DEFAULT_UPPER_DEBOUNCE_SECONDS,
     UPPER_DEBOUNCE_MIN_SECONDS,
     UPPER_DEBOUNCE_MAX_SECONDS,
@@ -135,6 +142,8 @@ from .const import (
     LOCK_WAIT_POLL_INTERVAL_S,
     PRIORITY_REFRESH_POLL_INTERVAL_S,
     PRIORITY_REFRESH_RETRIES,
+    PRIORITY_MODE_FLAG_TTL_S,
+    SHUTDOWN_TASK_DRAIN_TIMEOUT_S,
     OTHER_CHARGING_CHECK_RETRIES,
     OTHER_CHARGING_CHECK_INTERVAL_S,
     CE_VERIFY_DELAY_S,
@@ -168,7 +177,45 @@ REPORT_UNKNOWN_ENFORCE = False
 REPORT_UNKNOWN_TRANSITION_NEW = False
 REPORT_UNKNOWN_TRANSITION_OLD = False
 
-OPT_UPPER_DEBOUNCE_SECONDS = "upper_debounce_seconds"
+# Category of every context string passed to _report_unknown; unlisted contexts are categorized on the fly
+_CONTEXT_CATEGORY: Mapping[str, str] = MappingProxyType({
+    "cable_transition": "transition",
+    "charge_power_transition": "transition",
+    "charging_enable_transition": "transition",
+    "net_power_transition": "transition",
+    "soc_transition": "transition",
+    "status_transition": "transition",
+    "cable_initial": "initial",
+    "enable_ensure_off": "enforce",
+    "cable_get": "get",
+    "charging_enable_ce_write_get": "get",
+    "charging_enable_get": "get",
+    "current_get": "get",
+    "lock_get": "get",
+    "sensor_float_get": "get",
+    "soc_get": "get",
+    "status_get": "get",
+})
+
+# (category, side) -> report flag; combinations not listed (e.g. "other") always report
+_REPORT_UNKNOWN_FLAGS: Mapping[Tuple[str, Optional[str]], bool] = MappingProxyType({
+    ("get", None): REPORT_UNKNOWN_GETTERS,
+    ("get", "new"): REPORT_UNKNOWN_GETTERS,
+    ("get", "old"): REPORT_UNKNOWN_GETTERS,
+    ("initial", None): REPORT_UNKNOWN_INITIAL,
+    ("initial", "new"): REPORT_UNKNOWN_INITIAL,
+    ("initial", "old"): REPORT_UNKNOWN_INITIAL,
+    ("enforce", None): REPORT_UNKNOWN_ENFORCE,
+    ("enforce", "new"): REPORT_UNKNOWN_ENFORCE,
+    ("enforce", "old"): REPORT_UNKNOWN_ENFORCE,
+    ("transition", "new"): REPORT_UNKNOWN_TRANSITION_NEW,
+    ("transition", "old"): REPORT_UNKNOWN_TRANSITION_OLD,
+})
+
+_UNKNOWN_STATES = frozenset({"unknown", "unavailable"})
+
+# Lowercased once; incoming status states are compared after strip().lower()
+_WALLBOX_STATUS_CHARGING_NORM = WALLBOX_STATUS_CHARGING.strip().lower()
 
 # Auto phase switching storage keys (internal)
 AUTO_STOP_REASON_BELOW_LOWER = "below_lower"
@@ -185,10 +232,17 @@ class EVLoadController:
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry):
         self.hass = hass
         self.entry = entry
-        self._unsub_listeners: List[Callable[[], None]] = []
+        self._unsub_listeners: Tuple[Callable[[], None], ...] = ()
         self._state_store: Store = Store(hass, STATE_STORAGE_VERSION, f"{STATE_STORAGE_KEY_PREFIX}_{entry.entry_id}")
         self._state_loaded: bool = False
         self._state: Dict[str, Optional[object]] = {}
+        # Last payload handed to the store; identical saves are skipped
+        self._last_saved_state: Optional[dict] = None
+
+        # Merged data+options, rebuilt only when HA swaps in new data/options mappings
+        self._eff_cache: dict = {}
+        self._eff_src: Tuple[object, object] = (None, None)
+        self._upper_debounce_cached: int = DEFAULT_UPPER_DEBOUNCE_SECONDS
 
         self._modes: Dict[str, bool] = {
             MODE_ECO: True,
@@ -197,19 +251,23 @@ class EVLoadController:
             MODE_CHARGE_PLANNER: False,
             MODE_STARTSTOP_RESET: True,
         }
-        self._mode_listeners: List[Callable[[], None]] = []
+        # Keyed by registration token so removal is O(1) and duplicate callbacks stay distinct
+        self._mode_listeners: Dict[int, Callable[[], None]] = {}
+        self._mode_listener_seq: int = 0
 
         # Planner & SoC
         self._planner_start_dt: Optional[datetime] = None
         self._planner_stop_dt: Optional[datetime] = None
         self._soc_limit_percent: Optional[int] = None
 
-        eff = _effective_config(self.entry)
+        eff = self._eff_config()
         # Entities
         self._cable_entity: Optional[str] = eff.get(CONF_CABLE_CONNECTED)
         self._charging_enable_entity: Optional[str] = eff.get(CONF_CHARGING_ENABLE)
         self._current_setting_entity: Optional[str] = eff.get(CONF_CURRENT_SETTING)
         self._lock_entity: Optional[str] = eff.get(CONF_LOCK_SENSOR)
+        # Only lock-domain entities accept lock.lock / lock.unlock
+        self._lock_is_lock_domain: bool = bool(self._lock_entity and self._lock_entity.startswith("lock."))
         self._wallbox_status_entity: Optional[str] = eff.get(CONF_WALLBOX_STATUS)
         self._charge_power_entity: Optional[str] = eff.get(CONF_CHARGE_POWER)
         self._ev_soc_entity: Optional[str] = eff.get(CONF_EV_BATTERY_LEVEL) or None
@@ -222,21 +280,39 @@ class EVLoadController:
 
         # Supply profile
         profile_key = eff.get(CONF_SUPPLY_PROFILE)
-        if profile_key == "na_1ph_240":
-            _LOGGER.info("Supply profile 'na_1ph_240' migrated to 'eu_1ph_230'.")
-            profile_key = "eu_1ph_230"
-        profile_meta = SUPPLY_PROFILES.get(profile_key) if isinstance(profile_key, str) else None
+        profile_meta = None
+        if isinstance(profile_key, str):
+            migrated_key = SUPPLY_PROFILE_MIGRATIONS.get(profile_key)
+            if migrated_key:
+                _LOGGER.info("Supply profile '%s' migrated to '%s'.", profile_key, migrated_key)
+                profile_key = migrated_key
+            profile_meta = get_profile(profile_key)
         if not profile_meta:
             legacy_three = bool(eff.get(CONF_WALLBOX_THREE_PHASE, DEFAULT_WALLBOX_THREE_PHASE))
-            profile_meta = SUPPLY_PROFILES["eu_3ph_400"] if legacy_three else SUPPLY_PROFILES["eu_1ph_230"]
-        self._supply_profile_key: str = profile_key or ("eu_3ph_400" if profile_meta["phases"] == 3 else "eu_1ph_230")
-        self._supply_phases: int = int(profile_meta.get("phases", 1))
-        self._supply_phase_voltage_v: int = int(profile_meta.get("phase_voltage_v", 235 if self._supply_phases == 1 else 230))
-        self._profile_min_power_6a_w: int = int(
-            profile_meta.get("min_power_6a_w", profile_meta["phase_voltage_v"] * 6 * (self._supply_phases if self._supply_phases > 1 else 1))
+            profile_meta = SUPPLY_PROFILES["eu_3ph_400" if legacy_three else "eu_1ph_230"]
+        self._supply_profile_key: str = profile_key or ("eu_3ph_400" if profile_meta.phases == 3 else "eu_1ph_230")
+        self._supply_phases: int = profile_meta.phases
+        self._supply_phase_voltage_v: int = profile_meta.phase_voltage_v
+        self._profile_min_power_6a_w: int = profile_meta.min_power_6a_w
+        self._profile_reg_min_w: int = profile_meta.regulation_min_w
+        self._wallbox_three_phase: bool = self._supply_phases == 3
+        # Configured profile is fixed for this controller's lifetime; resolve its record once
+        self._supply_derived: Optional[SupplyDerived] = get_profile_derived(self._supply_profile_key)
+        # These depend only on the fixed profile above; resolved once rather than per regulation tick
+        self._regulation_min_w: int = self._profile_reg_min_w or (
+            REG_MIN_EU_3P_W if self._wallbox_three_phase else REG_MIN_EU_1P_W
+        )
+        if self._supply_derived is not None:
+            self._min_charge_power_w: int = self._supply_derived.min_charge_power_w
+        else:
+            self._min_charge_power_w = max(
+                self._profile_min_power_6a_w,
+                MIN_CHARGE_POWER_THREE_PHASE_W if self._wallbox_three_phase else MIN_CHARGE_POWER_SINGLE_PHASE_W,
+            )
+        self._min_band_w: int = (
+            self._supply_derived.band_min_w if self._supply_derived is not None
+            else (MIN_BAND_400 if self._wallbox_three_phase else MIN_BAND_230)
         )
-        self._profile_reg_min_w: int = int(profile_meta.get("regulation_min_w", 1300 if self._supply_phases == 1 else 3900))
-        self._wallbox_three_phase: bool = bool(self._supply_phases == 3)
 
         # Hysteresis thresholds
         self._eco_on_upper: float = float(eff.get(CONF_ECO_ON_UPPER, DEFAULT_ECO_ON_UPPER))
@@ -275,10 +351,12 @@ class EVLoadController:
         # Priority
         self._priority_allowed_cache: bool = True
         self._priority_mode_enabled: bool = False
+        self._priority_mode_refreshed_at: float = 0.0
+        self._priority_refresh_task: Optional[asyncio.Task] = None
 
         # Unknown handling
-        self._unknown_last_emit: Dict[Tuple[str, str], float] = {}
-        self._init_monotonic: float = time.monotonic()
+        self._unknown_last_emit: Dict[Tuple[str, str, Optional[str]], float] = {}
+        self._unknown_grace_until: float = time.monotonic() + UNKNOWN_STARTUP_GRACE_SECONDS
 
         # Trackers
         self._last_soc_allows: Optional[bool] = None
@@ -513,14 +591,30 @@ class EVLoadController:
         except Exception:
             _LOGGER.debug("Startup grace reconcile failed", exc_info=True)
 
+    # ---------------- Effective config cache ----------------
+    def _eff_config(self) -> dict:
+        """Return merged data+options; treat as read-only.
+
+        async_update_entry replaces entry.data/entry.options with new mappings on every change,
+        so an identity check is enough to detect staleness.
+        """
+        entry = self.entry
+        data, options = entry.data, entry.options
+        src = self._eff_src
+        if data is not src[0] or options is not src[1]:
+            eff = self._eff_cache = _effective_config(entry)
+            self._eff_src = (data, options)
+            try:
+                v = int(eff.get(CONF_UPPER_DEBOUNCE_SECONDS, DEFAULT_UPPER_DEBOUNCE_SECONDS))
+            except Exception:
+                v = DEFAULT_UPPER_DEBOUNCE_SECONDS
+            self._upper_debounce_cached = max(UPPER_DEBOUNCE_MIN_SECONDS, min(UPPER_DEBOUNCE_MAX_SECONDS, v))
+        return self._eff_cache
+
     # ---------------- Upper debounce helpers ----------------
     def _upper_debounce_seconds(self) -> int:
-        eff = _effective_config(self.entry)
-        try:
-            v = int(eff.get(OPT_UPPER_DEBOUNCE_SECONDS, DEFAULT_UPPER_DEBOUNCE_SECONDS))
-        except Exception:
-            v = DEFAULT_UPPER_DEBOUNCE_SECONDS
-        return max(UPPER_DEBOUNCE_MIN_SECONDS, min(UPPER_DEBOUNCE_MAX_SECONDS, v))
+        self._eff_config()
+        return self._upper_debounce_cached
 
     def _cancel_upper_timer(self):
         t = self._upper_timer_task
@@ -578,7 +672,7 @@ class EVLoadController:
             finally:
                 self._upper_timer_task = None
 
-        self._upper_timer_task = self._create_task(_runner())
+        self._upper_timer_task = self._create_internal_task(_runner())
 
     # ---------------- Post-start lock enforce (non-blocking wrapper) ----------------
     async def async_post_start(self):
@@ -590,7 +684,7 @@ class EVLoadController:
 
         # Run inner in background (never block HA startup)
         try:
-            self._create_task(self._async_post_start_inner())
+            self._create_internal_task(self._async_post_start_inner())
         except Exception:
             _LOGGER.debug("Failed to schedule _async_post_start_inner", exc_info=True)
 
@@ -611,18 +705,20 @@ class EVLoadController:
             self._install_midnight_daily_listener()
             return
         try:
-            deadline = time.monotonic() + POST_START_LOCK_DELAY_S
-            while time.monotonic() < deadline:
-                if self._cable_entity:
-                    st_cable = self.hass.states.get(self._cable_entity)
-                    if self._is_known_state(st_cable):
-                        await self._ensure_lock_locked()
-                        _LOGGER.debug("Post-start: lock enforced (cable=%s).", "on" if st_cable.state == STATE_ON else "off")
-                        self._install_midnight_daily_listener()
-                        return
-                await asyncio.sleep(1.0)
+            def _known_cable_state() -> Optional[str]:
+                if not self._cable_entity:
+                    return None
+                st_cable = self.hass.states.get(self._cable_entity)
+                return st_cable.state if self._is_known_state(st_cable) else None
+
+            cable_state = await self._async_wait_for_states(
+                [self._cable_entity] if self._cable_entity else [], _known_cable_state, POST_START_LOCK_DELAY_S
+            )
             await self._ensure_lock_locked()
-            _LOGGER.debug("Post-start: lock enforced (timeout fallback).")
+            if cable_state is not None:
+                _LOGGER.debug("Post-start: lock enforced (cable=%s).", "on" if cable_state == STATE_ON else "off")
+            else:
+                _LOGGER.debug("Post-start: lock enforced (timeout fallback).")
         except asyncio.CancelledError:
             return
         except Exception:
@@ -656,12 +752,7 @@ class EVLoadController:
                 return
             changed = self._roll_planner_dates_to_today_if_past()
             if changed:
-                await self._save_unified_state()
-                with contextlib.suppress(Exception):
-                    self.hass.bus.async_fire(
-                        PLANNER_DATETIME_UPDATED_EVENT,
-                        {"entry_id": self.entry.entry_id}
-                    )
+                await self._save_and_notify_planner()
                 _LOGGER.info("Midnight rollover: planner datetimes rolled to today (past dates).")
             else:
                 _LOGGER.debug("Midnight rollover: no change (dates already current or future).")
@@ -669,37 +760,33 @@ class EVLoadController:
             _LOGGER.debug("Midnight rollover (time change) failed", exc_info=True)
 
     def _roll_planner_dates_to_today_if_past(self) -> bool:
+        start_dt = self._planner_start_dt
+        stop_dt = self._planner_stop_dt
+        if start_dt is None and stop_dt is None:
+            return False
         today = dt_util.now().date()
         changed = False
 
-        def _roll_if_past(orig_dt: Optional[datetime]) -> Optional[datetime]:
-            if not orig_dt:
-                return None
-            if orig_dt.date() < today:
-                return orig_dt.replace(year=today.year, month=today.month, day=today.day)
-            return None
-
-        new_start = _roll_if_past(self._planner_start_dt)
-        if new_start:
-            self._planner_start_dt = new_start
+        if start_dt is not None and start_dt.date() < today:
+            self._planner_start_dt = start_dt.replace(year=today.year, month=today.month, day=today.day)
             changed = True
 
-        new_stop = _roll_if_past(self._planner_stop_dt)
-        if new_stop:
-            self._planner_stop_dt = new_stop
+        if stop_dt is not None and stop_dt.date() < today:
+            self._planner_stop_dt = stop_dt.replace(year=today.year, month=today.month, day=today.day)
             changed = True
 
         return changed
 
-    def _persist_planner_dates_notify_threadsafe(self):
-        async def _persist_and_notify():
-            await self._save_unified_state()
-            with contextlib.suppress(Exception):
-                self.hass.bus.async_fire(
-                    PLANNER_DATETIME_UPDATED_EVENT,
-                    {"entry_id": self.entry.entry_id}
-                )
+    @callback
+    def _fire_planner_updated(self) -> None:
+        with contextlib.suppress(Exception):
+            self.hass.bus.async_fire(PLANNER_DATETIME_UPDATED_EVENT, {"entry_id": self.entry.entry_id})
+
+    async def _save_and_notify_planner(self) -> None:
+        await self._save_unified_state()
+        self._fire_planner_updated()
 
+    def _persist_planner_dates_notify_threadsafe(self):
         try:
             loop = self.hass.loop
             try:
@@ -708,22 +795,26 @@ class EVLoadController:
                 running_loop = None
 
             if running_loop is loop:
-                self._create_task(_persist_and_notify())
+                self._create_task(self._save_and_notify_planner(), eager_start=True)
             else:
-                loop.call_soon_threadsafe(lambda: self._create_task(_persist_and_notify()))
+                loop.call_soon_threadsafe(lambda: self._create_task(self._save_and_notify_planner(), eager_start=True))
         except Exception:
             _LOGGER.debug("Failed to persist planner dates in a thread-safe manner", exc_info=True)
 
     # ---------------- Unknown helpers ----------------
     @staticmethod
     def _is_known_state(st) -> bool:
-        return bool(st and st.state not in ("unknown", "unavailable"))
+        return st is not None and st.state not in _UNKNOWN_STATES
 
     @staticmethod
     def _is_unknownish_state(st) -> bool:
-        return bool(st and st.state in ("unknown", "unavailable"))
+        return st is not None and st.state in _UNKNOWN_STATES
 
-    def _context_category(self, context: str) -> str:
+    @staticmethod
+    def _context_category(context: str) -> str:
+        cat = _CONTEXT_CATEGORY.get(context)
+        if cat is not None:
+            return cat
         if "transition" in context:
             return "transition"
         if "initial" in context:
@@ -735,21 +826,10 @@ class EVLoadController:
         return "other"
 
     def _should_report_unknown(self, context: str, side: Optional[str]) -> bool:
-        if (time.monotonic() - self._init_monotonic) < UNKNOWN_STARTUP_GRACE_SECONDS:
-            return self._context_category(context) == "transition" and side == "new" and REPORT_UNKNOWN_TRANSITION_NEW
         cat = self._context_category(context)
-        if cat == "get":
-            return REPORT_UNKNOWN_GETTERS
-        if cat == "initial":
-            return REPORT_UNKNOWN_INITIAL
-        if cat == "enforce":
-            return REPORT_UNKNOWN_ENFORCE
-        if cat == "transition":
-            if side == "new":
-                return REPORT_UNKNOWN_TRANSITION_NEW
-            if side == "old":
-                return REPORT_UNKNOWN_TRANSITION_OLD
-        return True
+        if time.monotonic() < self._unknown_grace_until:
+            return cat == "transition" and side == "new" and REPORT_UNKNOWN_TRANSITION_NEW
+        return _REPORT_UNKNOWN_FLAGS.get((cat, side), True)
 
     def _report_unknown(self, entity_id: Optional[str], raw_state: Optional[str], context: str, side: Optional[str] = None):
         if not entity_id or not self._should_report_unknown(context, side):
@@ -758,10 +838,10 @@ class EVLoadController:
         if st is not None:
             if st.attributes.get("restored"):
                 return
-            if raw_state in ("unavailable", "unknown") and (time.monotonic() - self._init_monotonic) < UNKNOWN_STARTUP_GRACE_SECONDS:
+            if raw_state in _UNKNOWN_STATES and time.monotonic() < self._unknown_grace_until:
                 return
         now = time.monotonic()
-        key = (entity_id, f"{context}:{side}" if side else context)
+        key = (entity_id, context, side)
         last = self._unknown_last_emit.get(key)
         if last and (now - last) < UNKNOWN_DEBOUNCE_SECONDS:
             return
@@ -781,7 +861,7 @@ class EVLoadController:
             return
         data = await self._state_store.async_load()
         if not isinstance(data, dict):
-            eff = _effective_config(self.entry)
+            eff = self._eff_config()
             eco_opt = eff.get(CONF_OPT_MODE_ECO)
             planner_start_iso = eff.get(CONF_PLANNER_START_ISO)
             planner_stop_iso = eff.get(CONF_PLANNER_STOP_ISO)
@@ -953,12 +1033,16 @@ class EVLoadController:
                 if self._auto_last_stop_ts_utc else None
             ),
         }
+        # Payload is flat JSON scalars; equal to the last write means nothing to persist
+        if to_save == self._last_saved_state:
+            return
         _LOGGER.debug(
             "Persist planner datetimes: start=%s stop=%s (planner_enabled=%s)",
             to_save["planner_start_iso"], to_save["planner_stop_iso"], to_save["planner_enabled"]
         )
         with contextlib.suppress(Exception):
             await self._state_store.async_save(to_save)
+            self._last_saved_state = to_save
 
     async def _save_unified_state_debounced(self) -> None:
         """Save state with debouncing to avoid rapid consecutive writes."""
@@ -985,9 +1069,12 @@ class EVLoadController:
         
     @staticmethod
     def _safe_int(v) -> Optional[int]:
+        if v is None or v == "":
+            return None
+        # Persisted ints come back as ints; bool falls through to the float path
+        if type(v) is int:
+            return v
         try:
-            if v in (None, ""):
-                return None
             return int(round(float(v)))
         except Exception:
             return None
@@ -995,6 +1082,15 @@ class EVLoadController:
     # ---------------- Priority helpers ----------------
     async def _refresh_priority_mode_flag(self):
         self._priority_mode_enabled = await async_get_priority_mode_enabled(self.hass)
+        self._priority_mode_refreshed_at = time.monotonic()
+
+    @callback
+    def _schedule_priority_refresh(self) -> None:
+        # Single-flight: a burst of state events shares the refresh already in progress
+        t = self._priority_refresh_task
+        if t is not None and not t.done():
+            return
+        self._priority_refresh_task = self._create_task(self._refresh_priority_mode_flag())
 
     async def _is_priority_allowed(self) -> bool:
         if not self._priority_mode_enabled:
@@ -1003,9 +1099,12 @@ class EVLoadController:
         return pid is None or pid == self.entry.entry_id
 
     async def _have_priority_now(self) -> bool:
-        await self._refresh_priority_mode_flag()
+        if time.monotonic() - self._priority_mode_refreshed_at >= PRIORITY_MODE_FLAG_TTL_S:
+            await self._refresh_priority_mode_flag()
         if not self._priority_mode_enabled:
             return True
+        # Alignment depends on other entries' live eligibility (cable, pauses), which is not
+        # signalled through on_global_priority_changed, so it is not cached
         with contextlib.suppress(Exception):
             await async_align_current_with_order(self.hass)
         try:
@@ -1018,7 +1117,7 @@ class EVLoadController:
     def on_global_priority_changed(self):
         if not self._state_loaded:
             return
-        self._create_task(self._refresh_priority_and_apply())
+        self._create_task(self._refresh_priority_and_apply(), eager_start=True)
 
     async def _refresh_priority_and_apply(self):
         await self._refresh_priority_mode_flag()
@@ -1059,7 +1158,7 @@ class EVLoadController:
         return self._is_cable_connected()
 
     def _max_current_a(self) -> int:
-        eff = _effective_config(self.entry)
+        eff = self._eff_config()
         try:
             v = int(eff.get(CONF_MAX_CURRENT_LIMIT_A, 16))
         except Exception:
@@ -1075,12 +1174,12 @@ class EVLoadController:
         self._auto_unlock_enabled = bool(enabled)
         if prev != self._auto_unlock_enabled:
             _LOGGER.debug("Auto unlock toggle → %s", self._auto_unlock_enabled)
-            self._create_task(self._save_unified_state_debounced())
+            self._create_task(self._save_unified_state_debounced(), eager_start=True)
             self._notify_mode_listeners()
 
     # ---------------- Phase switching: helpers ----------------
     def _phase_switch_supported(self) -> bool:
-        eff = _effective_config(self.entry)
+        eff = self._eff_config()
         return bool(eff.get(CONF_PHASE_SWITCH_SUPPORTED, False))
 
     def _is_wallbox_controlled_phase_switch(self) -> bool:
@@ -1649,17 +1748,20 @@ class EVLoadController:
 
     async def _phase_wait_for_power_stopped(self) -> bool:
         threshold = float(PHASE_SWITCH_STOPPED_POWER_W_DEFAULT)
-        deadline = time.monotonic() + float(PHASE_SWITCH_WAIT_FOR_STOP_SECONDS_DEFAULT)
 
-        while time.monotonic() < deadline:
+        def _stopped() -> Optional[bool]:
             if not self._is_cable_connected():
                 return True
             pw = self._get_charge_power_w()
             if pw is not None and pw <= threshold:
                 return True
-            await asyncio.sleep(LOCK_WAIT_POLL_INTERVAL_S)
+            return None
 
-        return False
+        entity_ids = [e for e in (self._cable_entity, self._charge_power_entity) if e]
+        stopped = await self._async_wait_for_states(
+            entity_ids, _stopped, float(PHASE_SWITCH_WAIT_FOR_STOP_SECONDS_DEFAULT)
+        )
+        return bool(stopped)
 
     # ---------------- Planner persist helpers ----------------
     async def async_set_planner_start_dt_persist(self, dt: Optional[datetime]):
@@ -1669,8 +1771,7 @@ class EVLoadController:
         await self._save_unified_state()
         if self._planner_enabled():
             await self._hysteresis_apply()
-        with contextlib.suppress(Exception):
-            self.hass.bus.async_fire(PLANNER_DATETIME_UPDATED_EVENT, {"entry_id": self.entry.entry_id})
+        self._fire_planner_updated()
 
     async def async_set_planner_stop_dt_persist(self, dt: Optional[datetime]):
         if dt:
@@ -1679,8 +1780,7 @@ class EVLoadController:
         await self._save_unified_state()
         if self._planner_enabled():
             await self._hysteresis_apply()
-        with contextlib.suppress(Exception):
-            self.hass.bus.async_fire(PLANNER_DATETIME_UPDATED_EVENT, {"entry_id": self.entry.entry_id})
+        self._fire_planner_updated()
 
     def set_planner_start_dt(self, dt: Optional[datetime]):
         if dt:
@@ -1702,7 +1802,7 @@ class EVLoadController:
         if not self._is_known_state(st):
             self._report_unknown(self._lock_entity, getattr(st, "state", None), "lock_get")
             return False
-        return str(st.state).strip().lower() == "unlocked"
+        return st.state == "unlocked"
 
     async def _ensure_lock_locked(self):
         # Policy: never force-lock while cable is connected; only lock on disconnect.
@@ -1711,13 +1811,12 @@ class EVLoadController:
             return
         if not self._lock_entity:
             return
+        if not self._lock_is_lock_domain:
+            return
         st = self.hass.states.get(self._lock_entity)
+        if st is not None and st.state == "locked":
+            return
         try:
-            if self._is_known_state(st) and str(st.state).strip().lower() == "locked":
-                return
-            dom, _ = self._lock_entity.split(".", 1)
-            if dom != "lock":
-                return
             await self.hass.services.async_call("lock", "lock", {"entity_id": self._lock_entity}, blocking=True)
             _LOGGER.info("Lock enforced → locked")
         except Exception:
@@ -1731,19 +1830,20 @@ class EVLoadController:
         if not self._is_cable_connected():
             return False
         try:
-            dom, _ = self._lock_entity.split(".", 1)
-            if dom != "lock":
+            if not self._lock_is_lock_domain:
                 return False
             _LOGGER.debug("Attempting lock.unlock for %s", self._lock_entity)
             await self.hass.services.async_call("lock", "unlock", {"entity_id": self._lock_entity}, blocking=True)
         except Exception:
             _LOGGER.debug("Failed to call lock.unlock for %s", self._lock_entity, exc_info=True)
             return False
-        deadline = time.monotonic() + max(LOCK_WAIT_POLL_INTERVAL_S, float(timeout_s))
-        while time.monotonic() < deadline:
-            if self._is_lock_unlocked():
-                return True
-            await asyncio.sleep(LOCK_WAIT_POLL_INTERVAL_S)
+        unlocked = await self._async_wait_for_states(
+            [self._lock_entity],
+            lambda: True if self._is_lock_unlocked() else None,
+            max(LOCK_WAIT_POLL_INTERVAL_S, float(timeout_s)),
+        )
+        if unlocked:
+            return True
         _LOGGER.info("Unlock timeout: lock stayed locked after %.1fs", timeout_s)
         return False
 
@@ -1757,24 +1857,59 @@ class EVLoadController:
         st = self._get_wallbox_status()
         if not st:
             return False
-        s = str(st).strip().lower()
-        exp = str(WALLBOX_STATUS_CHARGING).strip().lower() if WALLBOX_STATUS_CHARGING is not None else "charging"
-        return s == "charging" or s == exp
+        return st.strip().lower() == _WALLBOX_STATUS_CHARGING_NORM
 
     def _charging_detected_now(self) -> bool:
         status_ok = self._is_status_charging()
         power = self._get_charge_power_w()
         return bool(status_ok or (power is not None and power > CHARGING_POWER_THRESHOLD_W))
 
+    async def _async_wait_for_states(
+        self, entity_ids: List[str], check: Callable[[], Any], timeout_s: float
+    ) -> Any:
+        """Wait until check() returns something other than None; None on timeout.
+
+        check() runs once up front and then only when one of entity_ids changes state,
+        so waiting costs no loop wakeups. With no entities to watch it just sleeps out the timeout.
+        """
+        result = check()
+        if result is not None:
+            return result
+        if not entity_ids:
+            await asyncio.sleep(timeout_s)
+            return None
+
+        fut: asyncio.Future = self.hass.loop.create_future()
+
+        @callback
+        def _on_state_change(_event: Event) -> None:
+            if fut.done():
+                return
+            res = check()
+            if res is not None:
+                fut.set_result(res)
+
+        unsub = async_track_state_change_event(self.hass, entity_ids, _on_state_change)
+        try:
+            return await asyncio.wait_for(fut, timeout_s)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            unsub()
+
     async def _wait_for_charging_detection(self, timeout_s: float = CHARGING_WAIT_TIMEOUT_S) -> bool:
-        deadline = time.monotonic() + max(LOCK_WAIT_POLL_INTERVAL_S, float(timeout_s))
-        while time.monotonic() < deadline:
+        def _check() -> Optional[bool]:
             if not self._is_cable_connected():
                 return False
             if self._charging_detected_now():
                 return True
-            await asyncio.sleep(LOCK_WAIT_POLL_INTERVAL_S)
-        return False
+            return None
+
+        entity_ids = [e for e in (self._cable_entity, self._wallbox_status_entity, self._charge_power_entity) if e]
+        detected = await self._async_wait_for_states(
+            entity_ids, _check, max(LOCK_WAIT_POLL_INTERVAL_S, float(timeout_s))
+        )
+        return bool(detected)
 
     def _schedule_relock_after_charging_start(self, already_detected: bool = False):
         if not getattr(self, "_relock_enabled", False):
@@ -1784,23 +1919,33 @@ class EVLoadController:
         async def _runner():
             try:
                 if not already_detected:
-                    deadline = time.monotonic() + CHARGING_DETECTION_TIMEOUT_S
-                    while time.monotonic() < deadline:
+                    def _detect() -> Optional[str]:
+                        # "" = cable gone, "status"/"power" = detection source, None = keep waiting
                         if not self._is_cable_connected():
-                            _LOGGER.debug("Relock monitor aborted: cable disconnected")
-                            return
-                        status = self._get_wallbox_status()
+                            return ""
+                        if self._is_status_charging():
+                            return "status"
                         power = self._get_charge_power_w()
-                        if self._is_status_charging() or (power is not None and power > CHARGING_POWER_THRESHOLD_W):
-                            _LOGGER.debug(
-                                "Relock monitor: charging detected via %s (status=%s, power=%s)",
-                                "status" if self._is_status_charging() else "power", status, power
-                            )
-                            break
-                        await asyncio.sleep(1)
-                    else:
-                        _LOGGER.debug("Relock monitor timeout: no charging within 120s")
+                        if power is not None and power > CHARGING_POWER_THRESHOLD_W:
+                            return "power"
+                        return None
+
+                    entity_ids = [
+                        e for e in (self._cable_entity, self._wallbox_status_entity, self._charge_power_entity) if e
+                    ]
+                    source = await self._async_wait_for_states(entity_ids, _detect, CHARGING_DETECTION_TIMEOUT_S)
+                    if source is None:
+                        _LOGGER.debug("Relock monitor timeout: no charging within %ss", CHARGING_DETECTION_TIMEOUT_S)
                         return
+                    if not source:
+                        _LOGGER.debug("Relock monitor aborted: cable disconnected")
+                        return
+                    # status/power are re-read only for the message; skip the lookups unless debugging
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "Relock monitor: charging detected via %s (status=%s, power=%s)",
+                            source, self._get_wallbox_status(), self._get_charge_power_w()
+                        )
                 await asyncio.sleep(RELOCK_AFTER_CHARGING_SECONDS)
                 await self._ensure_lock_locked()
                 _LOGGER.info("Auto re-lock %ss after charging start executed", RELOCK_AFTER_CHARGING_SECONDS)
@@ -1815,7 +1960,7 @@ class EVLoadController:
 
     # ---------------- Auto phase switching (v1: stopped-based) ----------------
     def _auto_delay_seconds(self) -> int:
-        eff = _effective_config(self.entry)
+        eff = self._eff_config()
         try:
             v = int(eff.get(CONF_AUTO_PHASE_SWITCH_DELAY_MIN, DEFAULT_AUTO_PHASE_SWITCH_DELAY_MIN))
         except Exception:
@@ -1899,7 +2044,7 @@ class EVLoadController:
     def _auto_upper_3p(self) -> float:
         """Return the effective 3p upper threshold for auto phase switching."""
         ext = self._ext_import_limit_w
-        eff = _effective_config(self.entry)
+        eff = self._eff_config()
         
         if self.get_mode(MODE_ECO):
             configured_upper = float(eff.get(CONF_ECO_ON_UPPER, DEFAULT_ECO_ON_UPPER))
@@ -1917,7 +2062,7 @@ class EVLoadController:
         return configured_upper
 
     def _auto_upper_alt(self) -> float:
-        eff = _effective_config(self.entry)
+        eff = self._eff_config()
         if self.get_mode(MODE_ECO):
             return float(eff.get(CONF_ECO_ON_UPPER_ALT, DEFAULT_ECO_ON_UPPER_ALT))
         return float(eff.get(CONF_ECO_OFF_UPPER_ALT, DEFAULT_ECO_OFF_UPPER_ALT))
@@ -2145,7 +2290,7 @@ class EVLoadController:
             return float(-ext) + float(MIN_BAND_400)
         
         # Use configured 3p thresholds (not ALT)
-        eff = _effective_config(self.entry)
+        eff = self._eff_config()
         if self.get_mode(MODE_ECO):
             return float(eff.get(CONF_ECO_ON_UPPER, DEFAULT_ECO_ON_UPPER))
         return float(eff.get(CONF_ECO_OFF_UPPER, DEFAULT_ECO_OFF_UPPER))
@@ -2156,7 +2301,7 @@ class EVLoadController:
         Respects max peak override if it's stricter than configured 1p thresholds.
         """
         ext = self._ext_import_limit_w
-        eff = _effective_config(self.entry)
+        eff = self._eff_config()
         
         if self.get_mode(MODE_ECO):
             base_lower = float(eff.get(CONF_ECO_ON_LOWER_ALT, DEFAULT_ECO_ON_LOWER_ALT))
@@ -2242,16 +2387,18 @@ class EVLoadController:
 
     # ---------------- Mode listeners ----------------
     def add_mode_listener(self, cb: Callable[[], None]) -> Callable[[], None]:
-        self._mode_listeners.append(cb)
+        token = self._mode_listener_seq
+        self._mode_listener_seq = token + 1
+        self._mode_listeners[token] = cb
 
         def _remove():
-            with contextlib.suppress(Exception):
-                self._mode_listeners.remove(cb)
+            self._mode_listeners.pop(token, None)
 
         return _remove
 
     def _notify_mode_listeners(self):
-        for cb in list(self._mode_listeners):
+        # Snapshot: a callback may add or remove listeners while we iterate
+        for cb in tuple(self._mode_listeners.values()):
             with contextlib.suppress(Exception):
                 cb()
 
@@ -2259,25 +2406,15 @@ class EVLoadController:
     def _planner_enabled(self) -> bool:
         return self.get_mode(MODE_CHARGE_PLANNER)
 
-    def _planner_window_valid(self) -> bool:
-        if not self._planner_enabled():
-            return True
-        if self._planner_start_dt is None or self._planner_stop_dt is None:
-            return False
-        return self._planner_start_dt < self._planner_stop_dt
-
-    def _is_within_planner_window(self) -> bool:
-        if not self._planner_enabled():
-            return True
-        if not self._planner_window_valid():
-            return False
-        now = dt_util.as_local(dt_util.utcnow())
-        return self._planner_start_dt <= now < self._planner_stop_dt
-
     def _planner_window_allows_start(self) -> bool:
         if not self._planner_enabled():
             return True
-        return self._planner_window_valid() and self._is_within_planner_window()
+        start_dt = self._planner_start_dt
+        stop_dt = self._planner_stop_dt
+        if start_dt is None or stop_dt is None or not start_dt < stop_dt:
+            return False
+        # Aware datetimes compare by instant; no local-time conversion needed
+        return start_dt <= dt_util.utcnow() < stop_dt
 
     # ---------------- SoC gating ----------------
     def _get_ev_soc_percent(self) -> Optional[float]:
@@ -2303,14 +2440,6 @@ class EVLoadController:
             return True
         return soc < self._soc_limit_percent
 
-    # ---------------- Supply minima ----------------
-    def _effective_regulation_min_power(self) -> int:
-        return self._profile_reg_min_w or (3900 if self._supply_phases == 3 else 1300)
-
-    def _effective_min_charge_power(self) -> int:
-        base = self._profile_min_power_6a_w
-        return max(base, MIN_CHARGE_POWER_THREE_PHASE_W if self._supply_phases == 3 else MIN_CHARGE_POWER_SINGLE_PHASE_W)
-
     # ---------------- Initialization / Shutdown ----------------
     async def async_initialize(self):
         await self._load_unified_state()
@@ -2323,7 +2452,7 @@ class EVLoadController:
 
         await self._refresh_priority_mode_flag()
         self._priority_allowed_cache = await self._is_priority_allowed()
-        self._init_monotonic = time.monotonic()
+        self._unknown_grace_until = time.monotonic() + UNKNOWN_STARTUP_GRACE_SECONDS
         with contextlib.suppress(Exception):
             self._last_soc_allows = self._soc_allows_start()
             self._last_missing_nonempty = bool(self._current_missing_components())
@@ -2368,23 +2497,23 @@ class EVLoadController:
         ready_ids = self._startup_ready_entity_ids()
         timeout_s = MQTT_READY_TIMEOUT_S
         deadline = time.monotonic() + timeout_s
-        last_log = 0.0
 
-        while time.monotonic() < deadline:
+        while (remaining := deadline - time.monotonic()) > 0:
             missing = [eid for eid in ready_ids if not self._is_entity_known(eid)]
             if not missing:
                 break
 
-            now = time.monotonic()
-            # Log every 10 seconds max
-            if now - last_log > 10.0:
-                last_log = now
-                _LOGGER.debug(
-                    "Late-start waiting for MQTT entities (%ds left): %s",
-                    int(deadline - now),
-                    ", ".join(missing),
-                )
-            await asyncio.sleep(1)
+            _LOGGER.debug(
+                "Late-start waiting for MQTT entities (%ds left): %s",
+                int(remaining),
+                ", ".join(missing),
+            )
+            # Wake only when a missing entity changes state; slices of 10 seconds keep the progress log
+            await self._async_wait_for_states(
+                missing,
+                lambda: True if all(self._is_entity_known(eid) for eid in missing) else None,
+                min(10.0, remaining),
+            )
 
         # Now start the integration work
         self._install_midnight_daily_listener()
@@ -2402,27 +2531,32 @@ class EVLoadController:
         # Mark as shutting down FIRST to prevent false external OFF detection
         self._shutting_down = True
         # Cancel all tracked background tasks first
-        cancelled_count = self._cancel_tracked_tasks()
+        cancelled_tracked = self._cancel_tracked_tasks()
         # Cancel pending debounced save
         if self._save_debounce_task and not self._save_debounce_task.done():
             self._save_debounce_task.cancel()
         self._save_debounce_task = None
-        if cancelled_count > 0:
-            _LOGGER.debug("EVCM %s: cancelled %d tracked tasks on shutdown", self._log_name(), cancelled_count)
+        if cancelled_tracked:
+            _LOGGER.debug("EVCM %s: cancelled %d tracked tasks on shutdown", self._log_name(), len(cancelled_tracked))
 
         self._cancel_auto_connect_task()
         self._stop_regulation_loop()
         self._cancel_phase_fallback_timer()
         self._cancel_ce_enable_retry()
         self._cancel_ce_disable_retry()
-        for t in [self._resume_task, self._planner_monitor_task, self._below_lower_task, self._no_data_task, self._reclaim_task, self._relock_task, self._upper_timer_task]:
+        named_tasks = (
+            self._resume_task, self._planner_monitor_task, self._below_lower_task, self._no_data_task,
+            self._reclaim_task, self._relock_task, self._upper_timer_task,
+        )
+        for t in named_tasks:
             if t and not t.done():
                 t.cancel()
         self._resume_task = self._planner_monitor_task = self._below_lower_task = self._no_data_task = self._reclaim_task = self._relock_task = self._upper_timer_task = None
-        for unsub in list(self._unsub_listeners):
+        unsubs = self._unsub_listeners
+        self._unsub_listeners = ()
+        for unsub in unsubs:
             with contextlib.suppress(Exception):
                 unsub()
-        self._unsub_listeners = []
         if self._midnight_unsub:
             with contextlib.suppress(Exception):
                 self._midnight_unsub()
@@ -2441,38 +2575,48 @@ class EVLoadController:
                 self._startup_grace_recheck_handle.cancel()
             self._startup_grace_recheck_handle = None
 
+        # Let cancelled tasks unwind (their finally blocks touch controller state) before a reload
+        # builds the next controller; bounded so a task that swallows cancellation cannot stall unload
+        current = asyncio.current_task()
+        pending = {
+            t for t in (*cancelled_tracked, *named_tasks)
+            if t is not None and t is not current and not t.done()
+        }
+        if pending:
+            await asyncio.wait(pending, timeout=SHUTDOWN_TASK_DRAIN_TIMEOUT_S)
+
     # ---------------- Subscriptions ----------------
     def _subscribe_listeners(self):
-        for unsub in list(self._unsub_listeners):
+        for unsub in self._unsub_listeners:
             with contextlib.suppress(Exception):
                 unsub()
-        self._unsub_listeners = []
+        self._unsub_listeners = ()
 
-        if self._cable_entity:
-            self._unsub_listeners.append(async_track_state_change_event(self.hass, self._cable_entity, self._async_cable_event))
-        if self._charging_enable_entity:
-            self._unsub_listeners.append(async_track_state_change_event(self.hass, self._charging_enable_entity, self._async_charging_enable_event))
-        if self._lock_entity:
-            self._unsub_listeners.append(async_track_state_change_event(self.hass, self._lock_entity, self._async_lock_event))
-        if self._wallbox_status_entity:
-            self._unsub_listeners.append(async_track_state_change_event(self.hass, self._wallbox_status_entity, self._async_wallbox_status_event))
-        if self._charge_power_entity:
-            self._unsub_listeners.append(async_track_state_change_event(self.hass, self._charge_power_entity, self._async_charge_power_event))
+        # (entity, handler) per watched entity; unconfigured entities are skipped
         if self._grid_single and self._grid_power_entity:
-            self._unsub_listeners.append(async_track_state_change_event(self.hass, self._grid_power_entity, self._async_net_power_event))
+            grid_specs = ((self._grid_power_entity, self._async_net_power_event),)
         else:
-            if self._grid_export_entity:
-                self._unsub_listeners.append(async_track_state_change_event(self.hass, self._grid_export_entity, self._async_net_power_event))
-            if self._grid_import_entity:
-                self._unsub_listeners.append(async_track_state_change_event(self.hass, self._grid_import_entity, self._async_net_power_event))
-        if self._ev_soc_entity:
-            self._unsub_listeners.append(async_track_state_change_event(self.hass, self._ev_soc_entity, self._async_ev_soc_event))
-
-        if self._phase_feedback_entity:
-            self._unsub_listeners.append(
-                async_track_state_change_event(self.hass, self._phase_feedback_entity, self._async_phase_feedback_event)
+            grid_specs = (
+                (self._grid_export_entity, self._async_net_power_event),
+                (self._grid_import_entity, self._async_net_power_event),
             )
+        specs = (
+            (self._cable_entity, self._async_cable_event),
+            (self._charging_enable_entity, self._async_charging_enable_event),
+            (self._lock_entity, self._async_lock_event),
+            (self._wallbox_status_entity, self._async_wallbox_status_event),
+            (self._charge_power_entity, self._async_charge_power_event),
+            *grid_specs,
+            (self._ev_soc_entity, self._async_ev_soc_event),
+            (self._phase_feedback_entity, self._async_phase_feedback_event),
+        )
+        self._unsub_listeners = tuple(
+            async_track_state_change_event(self.hass, entity_id, handler)
+            for entity_id, handler in specs
+            if entity_id
+        )
 
+        if self._phase_feedback_entity:
             # Prime phase feedback state immediately (otherwise we only update on change events)
             st = self.hass.states.get(self._phase_feedback_entity)
             if self._is_known_state(st):
@@ -2544,7 +2688,7 @@ class EVLoadController:
 
     # ---------------- Missing data / timers eval ----------------
     def _evaluate_missing_and_start_no_data_timer(self):
-        if self._planner_enabled() and (not self._planner_window_valid() or not self._is_within_planner_window()):
+        if not self._planner_window_allows_start():
             if self._no_data_since is not None:
                 _LOGGER.debug("No-data timer reset (planner inactive)")
             self._no_data_since = None
@@ -2585,7 +2729,7 @@ class EVLoadController:
         if not entity_id:
             return False
         st = self.hass.states.get(entity_id)
-        return bool(st and st.state not in ("unknown", "unavailable"))
+        return st is not None and st.state not in _UNKNOWN_STATES
 
     def _startup_ready_entity_ids(self) -> list[str]:
         ids: list[str] = []
@@ -2634,13 +2778,7 @@ class EVLoadController:
 
     # ---------------- Helper: profile min band ----------------
     def _profile_min_band_w(self) -> int:
-        try:
-            band = SUPPLY_PROFILE_MIN_BAND.get(self._supply_profile_key)
-            if band is None:
-                band = MIN_BAND_400 if self._supply_phases == 3 else MIN_BAND_230
-            return int(band)
-        except Exception:
-            return 4500 if self._supply_phases == 3 else 1700
+        return self._min_band_w
 
     def _max_peak_override_active(self) -> bool:
         """True if Max peak avg is stricter than the currently active lower threshold."""
@@ -2650,7 +2788,7 @@ class EVLoadController:
 
         # Use the correct lower threshold based on current phase mode
         if self._use_alt_thresholds():
-            eff = _effective_config(self.entry)
+            eff = self._eff_config()
             if self.get_mode(MODE_ECO):
                 base_lower = float(eff.get(CONF_ECO_ON_LOWER_ALT, DEFAULT_ECO_ON_LOWER_ALT))
             else:
@@ -2703,18 +2841,32 @@ class EVLoadController:
         task.add_done_callback(self._tracked_tasks.discard)
         return task
 
-    def _create_task(self, coro) -> asyncio.Task:
-        """Create and track a task."""
-        task = self.hass.async_create_task(coro)
+    def _create_task(self, coro, eager_start: Optional[bool] = None) -> asyncio.Task:
+        """Create and track a task.
+
+        eager_start is forwarded only when given, so HA's own default applies otherwise.
+        """
+        if eager_start is None:
+            task = self.hass.async_create_task(coro)
+        else:
+            task = self.hass.async_create_task(coro, eager_start=eager_start)
         return self._track_task(task)
 
-    def _cancel_tracked_tasks(self) -> int:
-        """Cancel all tracked tasks. Returns count of cancelled tasks."""
-        cancelled = 0
+    def _create_internal_task(self, coro) -> asyncio.Task:
+        """Create and track an eager task outside HA's task registry.
+
+        Only for controller-owned work that teardown cancels via _cancel_tracked_tasks
+        and that HA does not need to wait on during shutdown.
+        """
+        return self._track_task(create_eager_task(coro))
+
+    def _cancel_tracked_tasks(self) -> List[asyncio.Task]:
+        """Cancel all tracked tasks. Returns the tasks that were cancelled."""
+        cancelled: List[asyncio.Task] = []
         for task in list(self._tracked_tasks):
             if task and not task.done():
                 task.cancel()
-                cancelled += 1
+                cancelled.append(task)
         self._tracked_tasks.clear()
         return cancelled
 
@@ -2833,7 +2985,6 @@ class EVLoadController:
     def _async_cable_event(self, event: Event):
         old = event.data.get("old_state")
         new = event.data.get("new_state")
-        self._create_task(self._refresh_priority_mode_flag())
         if not (self._is_known_state(old) and self._is_known_state(new)):
             if self._is_unknownish_state(new):
                 self._report_unknown(self._cable_entity, getattr(new, "state", None), "cable_transition", side="new")
@@ -2841,6 +2992,7 @@ class EVLoadController:
                 if self._should_report_unknown("cable_transition", side="old"):
                     self._report_unknown(self._cable_entity, getattr(old, "state", None), "cable_transition", side="old")
             return
+        self._schedule_priority_refresh()
         self._handle_cable_change(old, new)
         self._evaluate_missing_and_start_no_data_timer()
 
@@ -2863,7 +3015,7 @@ class EVLoadController:
             # don't let cache-sync break event processing
             _LOGGER.debug("Failed to sync CE cache from event", exc_info=True)
 
-        self._create_task(self._refresh_priority_mode_flag())
+        self._schedule_priority_refresh()
 
         device_name = None
         with contextlib.suppress(Exception):
@@ -2911,7 +3063,7 @@ class EVLoadController:
                         if not self._is_wallbox_controlled_phase_switch():
                             msg = (
                                 f"External charging_enable ON detected for {device_name}\n"
-                                f"Last external ON: {dt_util.as_local(dt_util.utcnow()).strftime('%Y-%m-%d %H:%M:%S')}\n"
+                                f"Last external ON: {dt_util.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
                                 "External OFF latch cleared: yes\n"
                                 "Charging can resume."
                             )
@@ -2993,7 +3145,7 @@ class EVLoadController:
                                         else:
                                             msg = (
                                                 f"External charging_enable OFF detected for {device_name}\n"
-                                                f"Last external OFF: {dt_util.as_local(dt_util.utcnow()).strftime('%Y-%m-%d %H:%M:%S')}\n"
+                                                f"Last external OFF: {dt_util.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
                                                 f"Latched until cable disconnect: {'yes' if self._ce_external_off_latched else 'no'}\n"
                                                 "To reset, unplug the EV.\n"
                                                 "You can manually turn charging_enable ON but this is NOT ADVISED!\n"
@@ -3076,7 +3228,6 @@ class EVLoadController:
         old = event.data.get("old_state")
         new = event.data.get("new_state")
         ent = event.data.get("entity_id")
-        self._create_task(self._refresh_priority_mode_flag())
         if not (self._is_known_state(old) and self._is_known_state(new)):
             if self._is_unknownish_state(new):
                 self._report_unknown(ent, getattr(new, "state", None), "net_power_transition", side="new")
@@ -3084,6 +3235,7 @@ class EVLoadController:
                 if self._should_report_unknown("net_power_transition", side="old"):
                     self._report_unknown(ent, getattr(old, "state", None), "net_power_transition", side="old")
             return
+        self._schedule_priority_refresh()
         if self.get_mode(MODE_START_STOP) and not self.get_mode(MODE_MANUAL_AUTO):
             self._create_task(self._hysteresis_apply())
         self._evaluate_missing_and_start_no_data_timer()
@@ -3093,11 +3245,9 @@ class EVLoadController:
     def _async_wallbox_status_event(self, event: Event):
         old = event.data.get("old_state")
         new = event.data.get("new_state")
-        self._create_task(self._refresh_priority_mode_flag())
 
         if not self.get_mode(MODE_START_STOP):
-            self._create_task(self._ensure_charging_enable_off())
-            self._create_task(self._enforce_start_stop_policy())
+            self._create_task(self._enforce_start_stop_off())
             return
 
         if not (self._is_known_state(old) and self._is_known_state(new)):
@@ -3107,6 +3257,7 @@ class EVLoadController:
                 if self._should_report_unknown("status_transition", side="old"):
                     self._report_unknown(self._wallbox_status_entity, getattr(old, "state", None), "status_transition", side="old")
             return
+        self._schedule_priority_refresh()
 
         self._start_regulation_loop_if_needed()
         if self.get_mode(MODE_START_STOP):
@@ -3117,11 +3268,9 @@ class EVLoadController:
     def _async_charge_power_event(self, event: Event):
         old = event.data.get("old_state")
         new = event.data.get("new_state")
-        self._create_task(self._refresh_priority_mode_flag())
 
         if not self.get_mode(MODE_START_STOP):
-            self._create_task(self._ensure_charging_enable_off())
-            self._create_task(self._enforce_start_stop_policy())
+            self._create_task(self._enforce_start_stop_off())
             return
 
         if not (self._is_known_state(old) and self._is_known_state(new)):
@@ -3131,6 +3280,7 @@ class EVLoadController:
                 if self._should_report_unknown("charge_power_transition", side="old"):
                     self._report_unknown(self._charge_power_entity, getattr(old, "state", None), "charge_power_transition", side="old")
             return
+        self._schedule_priority_refresh()
 
         try:
             pw = float(new.state)
@@ -3149,7 +3299,7 @@ class EVLoadController:
         new = event.data.get("new_state")
         if not (self._is_known_state(old) and self._is_known_state(new)):
             return
-        if str(old.state).lower() == "locked" and str(new.state).lower() == "unlocked":
+        if old.state == "locked" and new.state == "unlocked":
             if self.get_mode(MODE_START_STOP) and self._is_cable_connected():
                 if self._essential_data_available() and self._planner_window_allows_start() and self._soc_allows_start():
                     async def _try_start_after_unlock():
@@ -3177,11 +3327,28 @@ class EVLoadController:
         allows = self._soc_allows_start()
         prev = self._last_soc_allows
         self._last_soc_allows = allows
-        if allows and prev is False and self._priority_mode_enabled:
-            self._create_task(async_align_current_with_order(self.hass))
-        self._create_task(self._hysteresis_apply())
+        self._create_task(self._on_event_followup(
+            align=bool(allows and prev is False and self._priority_mode_enabled), hysteresis=True
+        ))
         self._evaluate_missing_and_start_no_data_timer()
 
+    async def _on_event_followup(self, *, align: bool = False, hysteresis: bool = False) -> None:
+        """Run an event callback's follow-up work in one task, aligning the order before regulating."""
+        if align:
+            with contextlib.suppress(Exception):
+                await async_align_current_with_order(self.hass)
+        if hysteresis:
+            await self._hysteresis_apply()
+
+    async def _enforce_start_stop_off(self) -> None:
+        # Independent steps: a slow or failing charging_enable write must not hold up the policy
+        results = await asyncio.gather(
+            self._ensure_charging_enable_off(), self._enforce_start_stop_policy(), return_exceptions=True
+        )
+        for res in results:
+            if isinstance(res, Exception):
+                _LOGGER.debug("Start/Stop OFF enforcement step failed", exc_info=res)
+
     # ---------------- Cable handling ----------------
     def _handle_cable_change(self, old_state, new_state):
         connected = (new_state.state if new_state else None) == STATE_ON
@@ -3331,7 +3498,7 @@ class EVLoadController:
 
                 if status_e:
                     st = self.hass.states.get(status_e)
-                    if st is not None and st.state and str(st.state).strip().lower() == str(WALLBOX_STATUS_CHARGING).strip().lower():
+                    if st is not None and st.state and st.state.strip().lower() == _WALLBOX_STATUS_CHARGING_NORM:
                         return True
 
                 if power_e:
@@ -3661,7 +3828,7 @@ class EVLoadController:
             return float(-self._ext_import_limit_w)
 
         if self._use_alt_thresholds():
-            eff = _effective_config(self.entry)
+            eff = self._eff_config()
             if self.get_mode(MODE_ECO):
                 return float(eff.get(CONF_ECO_ON_LOWER_ALT, DEFAULT_ECO_ON_LOWER_ALT))
             return float(eff.get(CONF_ECO_OFF_LOWER_ALT, DEFAULT_ECO_OFF_LOWER_ALT))
@@ -3678,7 +3845,7 @@ class EVLoadController:
             return float(self._current_lower() + min_band)
 
         if self._use_alt_thresholds():
-            eff = _effective_config(self.entry)
+            eff = self._eff_config()
             if self.get_mode(MODE_ECO):
                 return float(eff.get(CONF_ECO_ON_UPPER_ALT, DEFAULT_ECO_ON_UPPER_ALT))
             return float(eff.get(CONF_ECO_OFF_UPPER_ALT, DEFAULT_ECO_OFF_UPPER_ALT))
@@ -3860,7 +4027,7 @@ class EVLoadController:
             task.cancel()
 
     def _sustain_seconds(self) -> int:
-        eff = _effective_config(self.entry)
+        eff = self._eff_config()
         raw = eff.get(CONF_SUSTAIN_SECONDS)
         try:
             val = int(raw) if raw not in (None, "") else DEFAULT_SUSTAIN_SECONDS
@@ -4068,24 +4235,29 @@ class EVLoadController:
                 # - regMin: follows FEEDBACK (actual charging state) to know if wallbox is stable
                 
                 reg_profile_key = self._effective_reg_profile_key()
-                thr = SUPPLY_PROFILE_REG_THRESHOLDS.get(reg_profile_key) or {}
-                inc_export = float(thr.get("export_inc_w", 250))
-                dec_import = float(thr.get("import_dec_w", 0))
+                if reg_profile_key == self._supply_profile_key:
+                    derived = self._supply_derived
+                else:
+                    derived = get_profile_derived(reg_profile_key)
+                if derived is not None:
+                    inc_export, dec_import = derived.export_inc_w, derived.import_dec_w
+                else:
+                    inc_export, dec_import = DEFAULT_REG_THRESHOLDS
 
                 # regMin: use lowest value when fallback/mismatch to ensure regulation can work
                 # Conservative inc/dec thresholds (3p) already prevent aggressive adjustments
                 if self._phase_switch_supported():
                     if self._phase_fallback_active or self._phase_feedback_value not in ("1p", "3p"):
                         # Mismatch or unknown: use lowest regMin so regulation can work
-                        reg_min = int(SUPPLY_PROFILES["eu_1ph_230"].get("regulation_min_w", 1300))
+                        reg_min = SUPPLY_PROFILES["eu_1ph_230"].regulation_min_w
                     elif self._phase_feedback_value == "1p":
-                        reg_min = int(SUPPLY_PROFILES["eu_1ph_230"].get("regulation_min_w", 1300))
+                        reg_min = SUPPLY_PROFILES["eu_1ph_230"].regulation_min_w
                     else:
                         # feedback = 3p, no mismatch
-                        reg_min = int(SUPPLY_PROFILES["eu_3ph_400"].get("regulation_min_w", 3900))
+                        reg_min = SUPPLY_PROFILES["eu_3ph_400"].regulation_min_w
                 else:
-                    # No phase switching: use configured profile
-                    reg_min = int((SUPPLY_PROFILES.get(self._supply_profile_key) or {}).get("regulation_min_w", self._effective_regulation_min_power()))
+                    # No phase switching: reg_profile_key is the configured profile
+                    reg_min = self._regulation_min_w
                     
                 _LOGGER.debug(
                     "RegTick: net=%s target=%s currentA=%s status=%s enable=%s charge_power=%s soc=%s limit=%s active=%s missing=%s maxA=%s regMin=%s reg_profile=%s inc=%s dec=%s feedback=%s",
@@ -4249,8 +4421,8 @@ class EVLoadController:
             device_name = self._device_name_for_notify()
             msg = (
                 f"Charging enable seems to have no effect for {device_name}.\n\n"
-                f"EVCM tried to turn charging_enable ON every {int(CE_ENABLE_RETRY_INTERVAL_S)}s "
-                f"for {int(CE_ENABLE_MAX_RETRIES)} attempts, but the entity state did not become ON.\n\n"
+                f"EVCM tried to turn charging_enable ON every {CE_ENABLE_RETRY.interval_s}s "
+                f"for {CE_ENABLE_RETRY.max_retries} attempts, but the entity state did not become ON.\n\n"
                 "Possible causes:\n"
                 "- Wallbox offline/rebooting while HA entities remain sticky\n"
                 "- Integration not updating charging_enable state\n"
@@ -4268,9 +4440,10 @@ class EVLoadController:
 
     async def _ce_enable_retry_loop(self) -> None:
         """Retry enabling charging_enable if desired ON but state stays OFF."""
+        interval_s, max_retries = CE_ENABLE_RETRY
         try:
             while self._ce_enable_retry_active:
-                await asyncio.sleep(float(CE_ENABLE_RETRY_INTERVAL_S))
+                await asyncio.sleep(interval_s)
 
                 # Stop conditions
                 if not self._ce_wants_enable_on_now():
@@ -4323,11 +4496,11 @@ class EVLoadController:
 
                 # Retry budget
                 self._ce_enable_retry_count += 1
-                if self._ce_enable_retry_count > int(CE_ENABLE_MAX_RETRIES):
+                if self._ce_enable_retry_count > max_retries:
                     _LOGGER.warning(
                         "EVCM %s: CE ON retries exhausted (%s attempts) entity=%s",
                         self._log_name(),
-                        CE_ENABLE_MAX_RETRIES,
+                        max_retries,
                         self._charging_enable_entity,
                     )
                     await self._notify_ce_enable_no_effect()
@@ -4338,7 +4511,7 @@ class EVLoadController:
                     "EVCM %s: CE ON retry attempt %s/%s: charging_enable still OFF -> re-sending ON (entity=%s)",
                     self._log_name(),
                     self._ce_enable_retry_count,
-                    CE_ENABLE_MAX_RETRIES,
+                    max_retries,
                     self._charging_enable_entity,
                 )
 
@@ -4438,8 +4611,8 @@ class EVLoadController:
             device_name = self._device_name_for_notify()
             msg = (
                 f"Charging disable seems to have no effect for {device_name}.\n\n"
-                f"EVCM tried to turn charging_enable OFF every {int(CE_DISABLE_RETRY_INTERVAL_S)}s "
-                f"for {int(CE_DISABLE_MAX_RETRIES)} attempts, but the entity state did not become OFF.\n\n"
+                f"EVCM tried to turn charging_enable OFF every {CE_DISABLE_RETRY.interval_s}s "
+                f"for {CE_DISABLE_RETRY.max_retries} attempts, but the entity state did not become OFF.\n\n"
                 "Possible causes:\n"
                 "- Wallbox/integration not updating charging_enable state\n"
                 "- Command not reaching the wallbox\n"
@@ -4456,9 +4629,10 @@ class EVLoadController:
 
     async def _ce_disable_retry_loop(self) -> None:
         """Retry disabling charging_enable if desired OFF but state stays ON."""
+        interval_s, max_retries = CE_DISABLE_RETRY
         try:
             while self._ce_disable_retry_active:
-                await asyncio.sleep(float(CE_DISABLE_RETRY_INTERVAL_S))
+                await asyncio.sleep(interval_s)
 
                 # Stop conditions: only enforce OFF while Start/Stop is OFF and cable is connected
                 if not self._ce_wants_disable_off_now():
@@ -4475,11 +4649,11 @@ class EVLoadController:
 
                 # Retry budget
                 self._ce_disable_retry_count += 1
-                if self._ce_disable_retry_count > int(CE_DISABLE_MAX_RETRIES):
+                if self._ce_disable_retry_count > max_retries:
                     _LOGGER.warning(
                         "EVCM %s: CE OFF retries exhausted (%s attempts) entity=%s",
                         self._log_name(),
-                        CE_DISABLE_MAX_RETRIES, 
+                        max_retries, 
                         self._charging_enable_entity
                     )
                     await self._notify_ce_disable_no_effect()
@@ -4490,7 +4664,7 @@ class EVLoadController:
                     "EVCM %s: CE OFF retry attempt %s/%s: charging_enable still not OFF -> re-sending OFF. (entity=%s)",
                     self._log_name(),
                     self._ce_disable_retry_count, 
-                    CE_DISABLE_MAX_RETRIES,
+                    max_retries,
                     self._charging_enable_entity
                 )
 
@@ -4856,7 +5030,8 @@ class EVLoadController:
 
     # ---------------- Mode management ----------------
     def get_mode(self, mode: str) -> bool:
-        return bool(self._modes.get(mode, False))
+        # Every write stores a bool, so no coercion is needed on this hot read
+        return self._modes.get(mode, False)
 
     def set_mode(self, mode: str, enabled: bool):
         previous = self._modes.get(mode)
@@ -4889,8 +5064,7 @@ class EVLoadController:
                     self._create_task(self._dismiss_external_on_notification())
 
                     # Enforce OFF (retry is now handled inside _ensure_charging_enable_off)
-                    self._create_task(self._ensure_charging_enable_off())
-                    self._create_task(self._enforce_start_stop_policy())
+                    self._create_task(self._enforce_start_stop_off())
 
                     async def _verify_enable_off_later():
                         try:
@@ -5013,6 +5187,6 @@ class EVLoadController:
 
     # ---------------- Public helpers ----------------
     def get_min_charge_power_w(self) -> int:
-        return self._effective_min_charge_power()
+        return self._min_charge_power_w
 
 # EOF
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from typing import Optional, List, Dict
@@ -13,6 +14,10 @@ _LOGGER = logging.getLogger(__name__)
 PRIORITY_STORE_VERSION = 1
 PRIORITY_STORE_KEY = f"{DOMAIN}_global"
 
+# Serializes load -> modify -> save on the shared store; kept outside hass.data[DOMAIN],
+# which is dropped when the last entry unloads
+_STORE_LOCK_KEY = f"{DOMAIN}_priority_store_lock"
+
 # Runtime (non-persistent) pauses
 _PAUSES_KEY = "priority_pauses"
 VALID_PAUSE_REASONS = {"below_lower", "no_data"}
@@ -32,6 +37,13 @@ async def _save_raw(hass: HomeAssistant, data: dict) -> None:
     await _store(hass).async_save({"version": PRIORITY_STORE_VERSION, **data})
 
 
+def _store_lock(hass: HomeAssistant) -> asyncio.Lock:
+    lock = hass.data.get(_STORE_LOCK_KEY)
+    if lock is None:
+        lock = hass.data[_STORE_LOCK_KEY] = asyncio.Lock()
+    return lock
+
+
 def _existing_entry_ids(hass: HomeAssistant) -> List[str]:
     return [e.entry_id for e in hass.config_entries.async_entries(DOMAIN)]
 
@@ -83,10 +95,11 @@ async def async_get_priority_mode_enabled(hass: HomeAssistant) -> bool:
 
 
 async def async_set_priority_mode_enabled(hass: HomeAssistant, enabled: bool, *, notify: bool = True) -> None:
-    data = await _load_raw(hass)
-    prev = bool(data.get("priority_mode_enabled", False))
-    data["priority_mode_enabled"] = bool(enabled)
-    await _save_raw(hass, data)
+    async with _store_lock(hass):
+        data = await _load_raw(hass)
+        prev = bool(data.get("priority_mode_enabled", False))
+        data["priority_mode_enabled"] = bool(enabled)
+        await _save_raw(hass, data)
     if prev != enabled:
         _LOGGER.debug("Priority mode set to %s (notify=%s)", enabled, notify)
         if notify:
@@ -113,24 +126,26 @@ async def async_get_preferred_priority(hass: HomeAssistant) -> Optional[str]:
 
 
 async def _set_priority_value(hass: HomeAssistant, entry_id: Optional[str], notify: bool = True) -> None:
-    data = await _load_raw(hass)
-    exist = _existing_entry_ids(hass)
-    valid = entry_id if isinstance(entry_id, str) and entry_id in exist else None
-    data["priority_entry_id"] = valid
-    await _save_raw(hass, data)
+    async with _store_lock(hass):
+        data = await _load_raw(hass)
+        exist = _existing_entry_ids(hass)
+        valid = entry_id if isinstance(entry_id, str) and entry_id in exist else None
+        data["priority_entry_id"] = valid
+        await _save_raw(hass, data)
     _LOGGER.info("Global priority (current) set to: %s", _name_for(hass, valid))
     if notify:
         _notify_all_priority_change(hass)
 
 
 async def async_set_priority(hass: HomeAssistant, entry_id: Optional[str]) -> None:
-    data = await _load_raw(hass)
-    exist = _existing_entry_ids(hass)
-    valid = entry_id if isinstance(entry_id, str) and entry_id in exist else None
-    data["priority_entry_id"] = valid
-    if valid:
-        data["preferred_priority_entry_id"] = valid
-    await _save_raw(hass, data)
+    async with _store_lock(hass):
+        data = await _load_raw(hass)
+        exist = _existing_entry_ids(hass)
+        valid = entry_id if isinstance(entry_id, str) and entry_id in exist else None
+        data["priority_entry_id"] = valid
+        if valid:
+            data["preferred_priority_entry_id"] = valid
+        await _save_raw(hass, data)
     _LOGGER.info("Priority set (current=%s, preferred=%s)",
                 _name_for(hass, data.get("priority_entry_id")),
                 _name_for(hass, data.get("preferred_priority_entry_id")))
@@ -155,13 +170,13 @@ async def async_clear_priority_pause(hass: HomeAssistant, entry_id: str, reason:
     rec = pauses.get(entry_id)
     if not rec:
         return
-    if reason in rec:
-        rec.pop(reason, None)
-        if not rec:
-            pauses.pop(entry_id, None)
-        _LOGGER.info("Priority pause cleared: entry=%s reason=%s", _name_for(hass, entry_id), reason)
-        if notify:
-            _notify_all_priority_change(hass)
+    if rec.pop(reason, None) is None:
+        return
+    if not rec:
+        pauses.pop(entry_id, None)
+    _LOGGER.info("Priority pause cleared: entry=%s reason=%s", _name_for(hass, entry_id), reason)
+    if notify:
+        _notify_all_priority_change(hass)
 
 
 async def async_clear_all_priority_pauses(hass: HomeAssistant, entry_id: str, notify: bool = True) -> None:
@@ -243,11 +258,12 @@ async def async_set_order(hass: HomeAssistant, order: List[str]) -> None:
     seen = set()
     order = [e for e in order if not (e in seen or seen.add(e))]
     order += [e for e in _sorted_by_name(hass, exist) if e not in order]
-    data = await _load_raw(hass)
-    data["order"] = order
     top = order[0] if order else None
-    data["preferred_priority_entry_id"] = top if isinstance(top, str) else None
-    await _save_raw(hass, data)
+    async with _store_lock(hass):
+        data = await _load_raw(hass)
+        data["order"] = order
+        data["preferred_priority_entry_id"] = top if isinstance(top, str) else None
+        await _save_raw(hass, data)
     _LOGGER.debug("Priority order updated: %s (preferred=%s)",
                 [_name_for(hass, e) for e in order],
                 _name_for(hass, top) if top else None)
@@ -269,28 +285,39 @@ async def async_set_entry_order_index(hass: HomeAssistant, entry_id: str, index_
 
 
 async def async_cleanup_priority_if_removed(hass: HomeAssistant) -> None:
-    data = await _load_raw(hass)
-    exist = _existing_entry_ids(hass)
-    changed = False
-    pid = data.get("priority_entry_id")
-    if pid and pid not in exist:
-        data["priority_entry_id"] = None
-        changed = True
-    pref = data.get("preferred_priority_entry_id")
-    if pref and pref not in exist:
-        data["preferred_priority_entry_id"] = None
-        changed = True
-    old_order: List[str] = [e for e in data.get("order", []) if isinstance(e, str)]
-    new_order = [e for e in old_order if e in exist]
-    for e in _sorted_by_name(hass, exist):
-        if e not in new_order:
-            new_order.append(e)
-    if new_order != old_order:
-        data["order"] = new_order
-        changed = True
-    if changed:
+    async with _store_lock(hass):
+        data = await _load_raw(hass)
+        exist = _existing_entry_ids(hass)
+        exist_set = frozenset(exist)
+        pid = data.get("priority_entry_id")
+        pref = data.get("preferred_priority_entry_id")
+        old_order: List[str] = [e for e in data.get("order", []) if isinstance(e, str)]
+        # Common case: nothing was removed and the stored order is already consistent
+        if (
+            (not pid or pid in exist_set)
+            and (not pref or pref in exist_set)
+            and len(old_order) == len(exist)
+            and set(old_order) == exist_set
+        ):
+            return
+        changed = False
+        if pid and pid not in exist_set:
+            data["priority_entry_id"] = None
+            changed = True
+        if pref and pref not in exist_set:
+            data["preferred_priority_entry_id"] = None
+            changed = True
+        new_order = [e for e in old_order if e in exist_set]
+        for e in _sorted_by_name(hass, exist):
+            if e not in new_order:
+                new_order.append(e)
+        if new_order != old_order:
+            data["order"] = new_order
+            changed = True
+        if not changed:
+            return
         await _save_raw(hass, data)
-        _notify_all_priority_change(hass)
+    _notify_all_priority_change(hass)
 
 
 # ---------- Align ----------
@@ -366,10 +393,11 @@ async def async_enable_priority_mode_safe(hass: HomeAssistant) -> None:
     )
     
     # Step 1: Update priority_entry_id BEFORE enabling priority mode
-    data = await _load_raw(hass)
-    data["priority_entry_id"] = target_priority
-    data["preferred_priority_entry_id"] = target_priority
-    await _save_raw(hass, data)
+    async with _store_lock(hass):
+        data = await _load_raw(hass)
+        data["priority_entry_id"] = target_priority
+        data["preferred_priority_entry_id"] = target_priority
+        await _save_raw(hass, data)
     
     # Step 2: Enable priority mode WITHOUT notifying (we'll do that after)
     await async_set_priority_mode_enabled(hass, True, notify=False)
@@ -16,6 +16,7 @@ from .const import (
     CONF_NAME,
     CONF_PHASE_SWITCH_SUPPORTED,
     PHASE_SWITCH_MODE_OPTIONS,
+    PHASE_SWITCH_MODE_OPTIONS_SET,
     PHASE_SWITCH_MODE_AUTO,
     PHASE_SWITCH_MODE_FORCE_1P,
     PHASE_SWITCH_MODE_FORCE_3P,
@@ -113,7 +114,7 @@ class _PhaseSwitchModeSelect(SelectEntity):
             _LOGGER.debug("Phase switch mode selection blocked: wallbox-controlled mode active")
             return
 
-        if option not in PHASE_SWITCH_MODE_OPTIONS:
+        if option not in PHASE_SWITCH_MODE_OPTIONS_SET:
             return
 
         if option == PHASE_SWITCH_MODE_AUTO: